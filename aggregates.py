@@ -0,0 +1,90 @@
+import pandas as pd
+
+# ===================== RUNNING AGGREGATES =====================
+# Sums behind the Dashboard, footer and export summary. Each one is loaded
+# with a single pass when its table is first read, then adjusted per insert,
+# update and delete, so reading it is a dict lookup.
+
+TRACKED = [
+    ("plants", "Trimmed Yield (g)", None),
+    ("expenses", "Cost (ZAR)", None),
+    ("income", "Grams Sold", "Price per Gram"),
+]
+
+
+def _num(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if pd.isna(value) else value
+
+
+def row_value(row, column, weight=None):
+    value = _num(row.get(column))
+    return value if weight is None else value * _num(row.get(weight))
+
+
+def column_total(df, column, weight=None):
+    if len(df) == 0:
+        return 0.0
+    values = pd.to_numeric(df[column], errors="coerce").astype("float64")
+    if weight is not None:
+        values = values * pd.to_numeric(df[weight], errors="coerce").astype("float64")
+    return float(values.sum())
+
+
+class Aggregates:
+    def __init__(self):
+        self.sums = {}
+        self.counts = {}
+
+    def load(self, name, df):
+        self.counts[name] = 0
+        for key in TRACKED:
+            if key[0] == name:
+                self.sums[key] = 0.0
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        self.counts[name] = self.counts.get(name, 0) + len(df)
+        for key in self.sums:
+            if key[0] == name:
+                self.sums[key] += column_total(df, key[1], key[2])
+
+    def tracks(self, name, column, weight=None):
+        return (name, column, weight) in self.sums
+
+    def total(self, name, column, weight=None):
+        return self.sums[(name, column, weight)]
+
+    def _apply(self, name, row, sign):
+        for key in self.sums:
+            if key[0] == name:
+                self.sums[key] += sign * row_value(row, key[1], key[2])
+
+    def on_insert(self, name, row_id, row):
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self._apply(name, row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        self._apply(name, old, -1)
+        self._apply(name, new, 1)
+
+    def on_delete(self, name, row_id, row):
+        self.counts[name] -= 1
+        self._apply(name, row, -1)
+
+    def check(self, store, tolerance=1e-6):
+        # Recompute everything from the tables; returns only what drifted
+        drift = []
+        for name, count in self.counts.items():
+            actual = len(store.table(name).frame)
+            if actual != count:
+                drift.append({"Aggregate": f"{name} rows", "Maintained": count, "Recomputed": actual})
+        for (name, column, weight), value in self.sums.items():
+            actual = column_total(store.table(name).frame, column, weight)
+            if abs(actual - value) > tolerance * max(1.0, abs(actual)):
+                label = column if weight is None else f"{column} x {weight}"
+                drift.append({"Aggregate": f"{name}: {label}", "Maintained": value, "Recomputed": actual})
+        return drift
@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+import pandas as pd
+
+from aggregates import row_value
+
+# ===================== TIME-BUCKET ROLLUPS =====================
+# Income and expenses pre-summed per month / week and per month x category,
+# strain and payment method. Loaded with one groupby when the ledger tables
+# are first read, then adjusted per insert / update / delete, so the charts
+# only ever touch a few hundred bucket rows however long the ledger gets.
+
+FREQS = {"Monthly": "M", "Weekly": "W"}
+BLANK = "(blank)"
+
+# table -> (amount column, weight column), {breakdown: label column}
+SOURCES = {
+    "expenses": (("Cost (ZAR)", None), {"category": "Category"}),
+    "income": (("Grams Sold", "Price per Gram"), {"strain": "Strain", "payment": "Payment Method"}),
+}
+
+
+def bucket_starts(dates):
+    dates = pd.to_datetime(pd.Series(dates), errors="coerce").dt.normalize()
+    month = dates.dt.to_period("M").dt.start_time
+    week = dates - pd.to_timedelta(dates.dt.weekday, unit="D")
+    return month, week
+
+
+def _label(value):
+    return BLANK if value is None or pd.isna(value) or value == "" else str(value)
+
+
+class Rollups:
+    def __init__(self):
+        self.pnl = {"income": defaultdict(float), "expenses": defaultdict(float)}  # (freq, start)
+        self.breakdowns = {
+            "category": defaultdict(float),  # (month, Category) -> cost
+            "strain": defaultdict(float),    # (month, Strain) -> revenue
+            "payment": defaultdict(float),   # (month, Payment Method) -> revenue
+        }
+
+    def load(self, name, df):
+        if name not in SOURCES:
+            return
+        (column, weight), labels = SOURCES[name]
+        self.pnl[name].clear()
+        for kind in labels:
+            self.breakdowns[kind].clear()
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name not in SOURCES or len(df) == 0:
+            return
+        (column, weight), labels = SOURCES[name]
+        values = pd.to_numeric(df[column], errors="coerce")
+        if weight is not None:
+            values = values * pd.to_numeric(df[weight], errors="coerce")
+        month, week = bucket_starts(df["Date"])
+        values = pd.Series(values.fillna(0).to_numpy(), name="v")
+        month, week = month.reset_index(drop=True), week.reset_index(drop=True)
+
+        for freq, starts in (("M", month), ("W", week)):
+            for start, v in values.groupby(starts).sum().items():
+                self.pnl[name][(freq, start)] += v
+        for kind, col in labels.items():
+            keys = df[col].map(_label).reset_index(drop=True)
+            for (start, label), v in values.groupby([month, keys]).sum().items():
+                self.breakdowns[kind][(start, label)] += v
+
+    def copy(self):
+        other = Rollups()
+        for name, buckets in self.pnl.items():
+            other.pnl[name].update(buckets)
+        for kind, buckets in self.breakdowns.items():
+            other.breakdowns[kind].update(buckets)
+        return other
+
+    def _apply(self, name, row, sign):
+        if name not in SOURCES:
+            return
+        (column, weight), labels = SOURCES[name]
+        month, week = bucket_starts([row.get("Date")])
+        if pd.isna(month.iloc[0]):
+            return
+        value = sign * row_value(row, column, weight)
+        self.pnl[name][("M", month.iloc[0])] += value
+        self.pnl[name][("W", week.iloc[0])] += value
+        for kind, col in labels.items():
+            self.breakdowns[kind][(month.iloc[0], _label(row.get(col)))] += value
+
+    def on_insert(self, name, row_id, row):
+        self._apply(name, row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        self._apply(name, old, -1)
+        self._apply(name, new, 1)
+
+    def on_delete(self, name, row_id, row):
+        self._apply(name, row, -1)
+
+    # ---------- chart frames ----------
+    def profit_and_loss(self, freq="M"):
+        series = {
+            label: pd.Series({start: v for (f, start), v in self.pnl[name].items() if f == freq}, dtype=float)
+            for label, name in (("Income", "income"), ("Expenses", "expenses"))
+        }
+        df = pd.DataFrame(series).fillna(0.0).sort_index()
+        df = df[(df["Income"].abs() > 1e-9) | (df["Expenses"].abs() > 1e-9)]
+        df["Net"] = df["Income"] - df["Expenses"]
+        return df.rename_axis("Period").reset_index()
+
+    def months(self):
+        return sorted({start for (f, start) in self.pnl["income"] if f == "M"}
+                      | {start for (f, start) in self.pnl["expenses"] if f == "M"})
+
+    def breakdown(self, kind, start=None, end=None):
+        totals = defaultdict(float)
+        for (month, label), v in self.breakdowns[kind].items():
+            if (start is None or month >= start) and (end is None or month <= end):
+                totals[label] += v
+        s = pd.Series(totals, dtype=float)
+        return s[s.abs() > 1e-9].sort_values(ascending=False)
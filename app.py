@@ -1,39 +1,35 @@
+import importlib
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from datetime import datetime, date
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-import io
+
+from config import VALID_USERS, ADMINS, PAGES
+from instrumentation import recorder, section
+from storage import Storage
+from tables import TableStore, UserStore
+from views.search import render_box
+
+recorder.begin()
 
 # === USERNAME + PASSWORD + TRACKS WHO IS LOGGED IN ===
 if "user" not in st.session_state:
     st.session_state.user = None
 
-if st.session_state.user is None:
-    col1, col2 = st.columns(2)
-    with col1:
-        username = st.text_input("Username")
-    with col2:
-        password = st.text_input("Password", type="password")
-    
-    if st.button("Login"):
-        # ← add as many users as you want here
-        valid_users = {
-            "Michael": "KATVIS",
-            "Fanie":   "Zgtr2gn8Q4JteNa", 
-            # add more lines like this ↓
-            # "sarah":   "herpassword",
-        }
-        if username in valid_users and valid_users[username] == password:
-            st.session_state.user = username
-            st.success(f"Welcome {username}!")
-            st.rerun()
-        else:
-            st.error("Wrong username or password")
-    st.stop()
+with section("login"):
+    if st.session_state.user is None:
+        col1, col2 = st.columns(2)
+        with col1:
+            username = st.text_input("Username")
+        with col2:
+            password = st.text_input("Password", type="password")
+
+        if st.button("Login"):
+            if username in VALID_USERS and VALID_USERS[username] == password:
+                st.session_state.user = username
+                st.success(f"Welcome {username}!")
+                st.rerun()
+            else:
+                st.error("Wrong username or password")
+        st.stop()
 
 # Shows who is logged in at the top of the sidebar
 st.sidebar.success(f"Logged in as **{st.session_state.user}**")
@@ -45,456 +41,64 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 # ===================== INITIALISE DATA =====================
-def initialize_session_state():
-    if 'plants' not in st.session_state:
-        st.session_state.plants = pd.DataFrame(columns=[
-            'Plant ID', 'Strain Name', 'Variety', 'Gender', 'Environment', 'Type', 'Source', 'Batch #',
-            'Date Germination', 'Date Transplant Veg', 'Date Flip Flower', 'Date Harvest',
-            'Wet Weight (g)', 'Dry Weight (g)', 'Trimmed Yield (g)', 'Mother ID',
-            'Pot Size (L)', 'Medium', 'Phenotype Notes', 'Health Issues',
-            'Rating (1-10)', 'Photos Link', 'Status'
-        ])
-    if 'strains' not in st.session_state:
-        st.session_state.strains = pd.DataFrame(columns=[
-            'Strain Name', 'Breeder', 'Variety', 'Expected Flower Time', 'THC %',
-            'Terpene Profile', 'Average Yield (g/plant)', 'Times Grown', 'Best Pheno Notes', 'Keeper?'
-        ])
-    if 'expenses' not in st.session_state:
-        st.session_state.expenses = pd.DataFrame(columns=[
-            'Date', 'Category', 'Item', 'Supplier', 'Cost (ZAR)', 'Quantity', 'Paid To', 'Notes', 'Receipt Link'
-        ])
-    if 'income' not in st.session_state:
-        st.session_state.income = pd.DataFrame(columns=[
-            'Date', 'Strain', 'Grams Sold', 'Price per Gram', 'Buyer/Channel', 'Payment Method', 'Notes'
-        ])
-    if 'stock' not in st.session_state:
-        st.session_state.stock = pd.DataFrame(columns=[
-            'Strain', 'Breeder', 'Seeds Left', 'Pack Cost (ZAR)'
-        ])
-
-initialize_session_state()
-
-# ===================== AUTO CURRENT STAGE – FIXED & ACCURATE =====================
-def get_current_stage(row):
-    today = date.today()
-    germ = pd.to_datetime(row["Date Germination"], errors='coerce')
-    veg = pd.to_datetime(row["Date Transplant Veg"], errors='coerce')
-    flip = pd.to_datetime(row["Date Flip Flower"], errors='coerce')
-    harvest = pd.to_datetime(row["Date Harvest"], errors='coerce')
-
-    if pd.notna(harvest) and harvest <= today:
-        return "Harvested"
-    if pd.notna(flip):
-        days_in_flower = (today - flip).days
-        if days_in_flower >= 0:
-            week = days_in_flower // 7 + 1
-            return f"Flower Week {week}"
-    if pd.notna(veg):
-        days_in_veg = (today - veg).days
-        if days_in_veg >= 0:
-            week = days_in_veg // 7 + 1
-            return f"Veg Week {week}"
-    if pd.notna(germ):
-        days_germ = (today - germ).days
-        if days_germ >= 0:
-            week = days_germ // 7 + 1
-            return f"Germ Week {week}"
-    return "Not Started"
-
-# ===================== CALCULATIONS =====================
-def calculate_flowering_days(flip, harvest):
-    if pd.notna(flip) and pd.notna(harvest):
-        return (harvest - flip).days
-    return None
-
-def calculate_total_days(germ, harvest):
-    if pd.notna(germ) and pd.notna(harvest):
-        return (harvest - germ).days
-    return None
+@st.cache_resource
+def get_storage():
+    return Storage()
 
-# ===================== EXCEL EXPORT =====================
-def export_to_excel():
-    wb = Workbook()
-    wb.remove(wb.active)
+# One set of tables per server, shared by every logged-in session
+@st.cache_resource
+def get_store():
+    return TableStore(get_storage())
 
-    def header(ws, headers):
-        for c, h in enumerate(headers, 1):
-            cell = ws.cell(1, c, h)
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-
-    # Dashboard sheet
-    ws = wb.create_sheet("Dashboard")
-    ws.append(["Cannabis Grow Tracker - Summary"])
-    total_plants = len(st.session_state.plants)
-    total_yield = st.session_state.plants["Trimmed Yield (g)"].sum()
-    total_expenses = st.session_state.expenses["Cost (ZAR)"].sum()
-    total_income = (st.session_state.income["Grams Sold"] * st.session_state.income["Price per Gram"]).sum() if len(st.session_state.income)>0 else 0
-    ws.append(["Total Plants", total_plants])
-    ws.append(["Total Yield (g)", total_yield])
-    ws.append(["Total Expenses", total_expenses])
-    ws.append(["Total Income", total_income])
-    ws.append(["Net Profit", total_income - total_expenses])
-
-    # Plants sheet
-    ws = wb.create_sheet("Plants Tracker")
-    plants_df = st.session_state.plants.copy()
-    plants_df["Flowering Days"] = plants_df.apply(lambda row: calculate_flowering_days(row["Date Flip Flower"], row["Date Harvest"]), axis=1)
-    plants_df["Total Days"] = plants_df.apply(lambda row: calculate_total_days(row["Date Germination"], row["Date Harvest"]), axis=1)
-    header(ws, plants_df.columns.tolist())
-    for r in pd.DataFrame(plants_df).itertuples(index=False):
-        ws.append(list(r))
-
-        # Strains, Expenses, Income, Stock + Feeding Schedule
-    for name, df in [
-        ("Strains Library", st.session_state.strains),
-        ("Expenses", st.session_state.expenses),
-        ("Income", st.session_state.income),
-        ("Seed Stock", st.session_state.stock),
-        ("Feeding Schedule", st.session_state.feeding)
-    ]:
-        ws = wb.create_sheet(name)
-        header(ws, df.columns.tolist())
-        for r in df.itertuples(index=False):
-            ws.append(list(r))
+def initialize_session_state():
+    if 'tables' not in st.session_state or st.session_state.tables.user != st.session_state.user:
+        st.session_state.tables = UserStore(get_store(), st.session_state.user)
 
-    buffer = io.BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer
+with section("initialize_session_state"):
+    initialize_session_state()
+    store = st.session_state.tables
+    store.sync()
 
 # ===================== SIDEBAR =====================
 # === FIXED SIDEBAR WITH EMOJIS THAT ACTUALLY SHOW ===
 st.sidebar.markdown("### Navigation")
 
-pages = ["Dashboard","Plants Tracker","Strains Library","Expenses","Income","Seed Stock","Feeding Schedule","Export to Excel"]
-emojis = ["🏠","🌱","🧬","💰","💵","📦","🍽","📊"]
+with section("sidebar"):
+    for name, (emoji, _) in PAGES.items():
+        if st.sidebar.button(f"{emoji} {name}", use_container_width=True):
+            st.session_state.page = name
 
-for i, name in enumerate(pages):
-    if st.sidebar.button(f"{emojis[i]} {name}", use_container_width=True):
-        st.session_state.page = name
+with section("search"):
+    render_box(store)
 
 page = st.session_state.get("page", "Dashboard")
 
 # ===================== PAGES =====================
-if page == "Dashboard":
-    st.title("Dashboard")
-    c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Total Plants", len(st.session_state.plants))
-    c2.metric("Total Yield", f"{st.session_state.plants['Trimmed Yield (g)'].sum():.1f} g")
-    c3.metric("Total Expenses", f"R {st.session_state.expenses['Cost (ZAR)'].sum():,.2f}")
-    income = (st.session_state.income["Grams Sold"] * st.session_state.income["Price per Gram"]).sum() if len(st.session_state.income)>0 else 0
-    c4.metric("Total Income", f"R {income:,.2f}")
-    st.metric("Net Profit", f"R {income - st.session_state.expenses['Cost (ZAR)'].sum():,.2f}")
-
-elif page == "Plants Tracker":
-    st.title("Plants Tracker")
-    tab1, tab2 = st.tabs(["View Plants", "Add New Plant"])
-
-    with tab1:
-        if len(st.session_state.plants) > 0:
-            df = st.session_state.plants.copy()
-            df["Current Stage"] = df.apply(get_current_stage, axis=1)
-            df["Flowering Days"] = df.apply(
-                lambda r: calculate_flowering_days(r["Date Flip Flower"], r["Date Harvest"]), axis=1
-            )
-            df["Total Days"] = df.apply(
-                lambda r: calculate_total_days(r["Date Germination"], r["Date Harvest"]), axis=1
-            )
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No plants yet")
-
-    with tab2:
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            plant_id = st.text_input("Plant ID *")
-            strain = st.text_input("Strain Name *")
-            variety = st.selectbox("Variety", ["Sativa","Indica","Hybrid","Hybrid-Indica Dominant","Hybrid-Sativa Dominant","Autoflower"])
-            gender = st.selectbox("Gender", ["Female","Male","Hermaphrodite"])
-            environment = st.selectbox("Environment", ["Indoor","Outdoor","Greenhouse"])
-            type_p = st.selectbox("Type", ["Seed","Clone","Mother"])
-        with c2:
-            source = st.text_input("Source")
-            batch = st.text_input("Batch #")
-            date_germ = st.date_input("Date Germination", value=None)
-            date_trans = st.date_input("Date Transplant Veg", value=None)
-            date_flip = st.date_input("Date Flip Flower", value=None)
-            date_harvest = st.date_input("Date Harvest", value=None)
-        with c3:
-            pot = st.number_input("Pot Size (L)", 0.0, step=0.5)
-            medium = st.text_input("Medium")
-            rating = st.slider("Rating", 1, 10, 5)
-            status = st.selectbox("Status", ["Germinating","Veg","Flower","Drying","Cured","Sold","Gifted","Lost"])
-
-        notes = st.text_area("Phenotype Notes")
-        health = st.text_area("Health Issues")
-        photos = st.text_input("Photos Link")
-
-        if st.button("Add Plant", type="primary") and plant_id and strain:
-            new = pd.DataFrame([{
-                "Plant ID": plant_id, "Strain Name": strain, "Variety": variety, "Gender": gender,
-                "Environment": environment, "Type": type_p, "Source": source, "Batch #": batch,
-                "Date Germination": date_germ, "Date Transplant Veg": date_trans,
-                "Date Flip Flower": date_flip, "Date Harvest": date_harvest,
-                "Wet Weight (g)": 0, "Dry Weight (g)": 0, "Trimmed Yield (g)": 0,
-                "Mother ID": "", "Pot Size (L)": pot, "Medium": medium,
-                "Phenotype Notes": notes, "Health Issues": health,
-                "Rating (1-10)": rating, "Photos Link": photos, "Status": status
-            }])
-            st.session_state.plants = pd.concat([st.session_state.plants, new], ignore_index=True)
-            st.success("Plant added!")
-            st.rerun()
-
-elif page == "Strains Library":
-    st.title("Strains Library")
-    t1, t2 = st.tabs(["View Strains", "Add New Strain"])
-    with t1:
-        if len(st.session_state.strains)>0:
-            st.dataframe(st.session_state.strains, use_container_width=True, hide_index=True)
-        else:
-            st.info("No strains recorded yet")
-    with t2:
-        c1, c2 = st.columns(2)
-        with c1:
-            name = st.text_input("Strain Name *")
-            breeder = st.text_input("Breeder")
-            variety = st.selectbox("Variety", ["Sativa","Indica","Hybrid","Autoflower"])
-        with c2:
-            thc = st.number_input("THC %", 0.0, 40.0, step=0.1)
-            weeks = st.text_input("Expected Flower Time (weeks)")
-            keeper = st.selectbox("Keeper?", ["Yes","No","Maybe"])
-        notes = st.text_area("Best Pheno Notes")
-        if st.button("Add Strain", type="primary") and name:
-            new = pd.DataFrame([{"Strain Name": name, "Breeder": breeder, "Variety": variety,
-                                "Expected Flower Time": weeks, "THC %": thc, "Terpene Profile": "",
-                                "Average Yield (g/plant)": 0, "Times Grown": 0,
-                                "Best Pheno Notes": notes, "Keeper?": keeper}])
-            st.session_state.strains = pd.concat([st.session_state.strains, new], ignore_index=True)
-            st.success("Strain added!")
-            st.rerun()
-
-elif page == "Expenses":
-    st.title("Expenses Tracker")
-    categories = ["Seeds","Clones","Nutrients","Soil/Substrate","Pots/Fabric pots","Grow Lights","Tents/Fans",
-                  "Electricity","Water","Pest control","Labor","Salaries","Dividends","Donations","Marketing","Taxes","Misc"]
-    t1, t2 = st.tabs(["View", "Add Expense"])
-    with t1:
-        if len(st.session_state.expenses) > 0:
-            st.dataframe(st.session_state.expenses, use_container_width=True, hide_index=True)
-        else:
-            st.info("No expenses yet")
-    with t2:
-        c1, c2 = st.columns(2)
-        with c1:
-            date_e = st.date_input("Date", date.today())
-            cat = st.selectbox("Category", categories)
-            item = st.text_input("Item *")
-            cost = st.number_input("Cost (ZAR)", 0.0, step=0.01)
-        with c2:
-            qty = st.number_input("Quantity", 1, step=1)
-            paid = st.text_input("Paid To")
-            notes = st.text_area("Notes")
-        if st.button("Add Expense", type="primary"):
-            new = pd.DataFrame([{
-                "Date": date_e, "Category": cat, "Item": item, "Supplier": "", 
-                "Cost (ZAR)": cost, "Quantity": qty, "Paid To": paid, "Notes": notes, "Receipt Link": ""
-            }])
-            st.session_state.expenses = pd.concat([st.session_state.expenses, new], ignore_index=True)
-            st.success("Expense added!")
-            st.rerun()
-
-elif page == "Income":
-    st.title("Income Tracker")
-    t1, t2 = st.tabs(["View", "Add Income"])
-    with t1:
-        if len(st.session_state.income)>0:
-            df = st.session_state.income.copy()
-            df["Total"] = df["Grams Sold"] * df["Price per Gram"]
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No income yet")
-    with t2:
-        c1, c2 = st.columns(2)
-        with c1:
-            date_i = st.date_input("Date", date.today())
-            strain_i = st.text_input("Strain")
-            grams = st.number_input("Grams Sold", 0.0, step=0.1)
-            ppg = st.number_input("Price per Gram", 0.0, step=0.01)
-            source = st.selectbox("Source", ["Harvest Sale","Clone Sale","Capital Invested","Other"])
-        with c2:
-            buyer = st.text_input("Buyer/Channel")
-            method = st.selectbox("Payment Method", ["Cash","EFT","Crypto","Other"])
-        if st.button("Add Income", type="primary"):
-            new = pd.DataFrame([{"Date": date_i, "Strain": strain_i, "Grams Sold": grams,
-                                "Price per Gram": ppg, "Buyer/Channel": buyer,
-                                "Payment Method": method, "Notes": ""}])
-            st.session_state.income = pd.concat([st.session_state.income, new], ignore_index=True)
-            st.rerun()
-
-elif page == "Seed Stock":
-    st.title("Seed Stock")
-    t1, t2 = st.tabs(["View", "Add Stock"])
-
-    with t1:
-        if len(st.session_state.stock) > 0:
-            df = st.session_state.stock.copy()
-            df["Cost/Unit"] = df["Pack Cost (ZAR)"] / df["Seeds Left"].replace(0, 1)
-            df = df[["Strain", "Breeder", "Seeds Left", "Pack Cost (ZAR)", "Cost/Unit"]]
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No seed stock recorded yet")
-
-    with t2:
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            strain_s = st.text_input("Strain *", placeholder="e.g. Rosetta 78")
-        with c2:
-            breeder = st.text_input("Breeder (optional)", placeholder="e.g. Ethos")
-        with c3:
-            seeds_left = st.number_input("Seeds Left", min_value=0, step=1, value=10)
-        with c1:
-            pack_cost = st.number_input("Pack Cost (ZAR)", min_value=0.0, step=0.01, value=0.0)
-
-        if st.button("Add Stock", type="primary"):
-            if not strain_s.strip():
-                st.error("Strain name is required")
-            else:
-                new = pd.DataFrame([{
-                    "Strain": strain_s.strip(),
-                    "Breeder": breeder.strip(),
-                    "Seeds Left": int(seeds_left),
-                    "Pack Cost (ZAR)": float(pack_cost)
-                }])
-                st.session_state.stock = pd.concat([st.session_state.stock, new], ignore_index=True)
-                st.success(f"{strain_s} added to seed stock!")
-                st.rerun()
-                
-elif page == "Feeding Schedule":
-    st.title("Feeding Schedule")
-
-    # Initialize feeding dataframe
-    if 'feeding' not in st.session_state:
-        st.session_state.feeding = pd.DataFrame(columns=[
-            "Date", "Plant ID(s)", "Stage", "Nutrient 1", "Amount 1 (ml/L)",
-            "Nutrient 2", "Amount 2 (ml/L)", "Nutrient 3", "Amount 3 (ml/L)",
-            "Nutrient 4", "Amount 4 (ml/L)", "Nutrient 5", "Amount 5 (ml/L)", "Notes"
-        ])
-
-    tab1, tab2 = st.tabs(["Add Feeding", "History"])
-
-    with tab1:
-        with st.form("feeding_form", clear_on_submit=True):
-            feed_date = st.date_input("Date", value=date.today())
-
-            # Plant selection
-            if len(st.session_state.plants) == 0:
-                st.warning("No plants yet. Add plants first.")
-                plant_options = []
-            else:
-                current_plants = st.session_state.plants.copy()
-                current_plants["Current Stage"] = current_plants.apply(get_current_stage, axis=1)
-                plant_options = current_plants["Plant ID"].tolist()
-
-            selected_plant = st.selectbox("Select single plant", ["(none)"] + plant_options)
-            group = st.selectbox("Or feed a group", ["None", "All Plants", "All in Germ Week", "All in Veg Week", "All in Flower Week"])
-
-            final_plants = []
-            if group != "None":
-                if group == "All Plants":
-                    final_plants = plant_options
-                else:
-                    stage_prefix = group.replace("All in ", "")
-                    final_plants = current_plants[current_plants["Current Stage"].str.startswith(stage_prefix)]["Plant ID"].tolist()
-                st.info(f"Selected: {', '.join(final_plants)}")
-            elif selected_plant != "(none)":
-                final_plants = [selected_plant]
-
-            # Nutrients
-            nutrients = [
-                "CalMag Essential", "NC32", "Pot Grow", "Pot Flora",
-                "Pot Radix", "Bio-Blend", "Carbon K", "Multi Foliar Spray Concentrate",
-                "Other (type below)"
-            ]
-
-            col1, col2 = st.columns(2)
-            with col1:
-                nut1 = st.selectbox("Nutrient 1", ["None"] + nutrients)
-                if nut1 == "Other (type below)":
-                    nut1_name = st.text_input("Specify nutrient name")
-                else:
-                    nut1_name = nut1
-            with col2:
-                amt1 = st.number_input("Amount 1 (ml/L)", 0.0, step=0.1, key="a1")
-
-            more = st.radio("More nutrients?", ("No", "Yes"))
-            extra = {}
-
-            if more == "Yes":
-                how_many = st.selectbox("How many more?", [1,2,3,4,5])
-                for i in range(how_many):
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        n = st.selectbox(f"Nutrient {i+2}", nutrients, key=f"n{i+2}")
-                        if n == "Other (type below)":
-                            n_name = st.text_input(f"Specify name", key=f"on{i+2}")
-                        else:
-                            n_name = n
-                        extra[f"nut{i+2}"] = n_name
-                    with c2:
-                        extra[f"amt{i+2}"] = st.number_input(f"Amount {i+2} (ml/L)", 0.0, step=0.1, key=f"a{i+2}")
-
-            notes = st.text_area("Notes (pH, EC, water volume, etc.)")
-
-            if st.form_submit_button("Record Feeding", type="primary"):
-                if not final_plants:
-                    st.error("Select at least one plant")
-                elif nut1 == "None":
-                    st.error("Select at least one nutrient")
-                else:
-                    row = {
-                        "Date": feed_date,
-                        "Plant ID(s)": ", ".join(final_plants),
-                        "Stage": group if group != "None" else current_plants[current_plants["Plant ID"].isin(final_plants)]["Current Stage"].iloc[0],
-                        "Nutrient 1": nut1_name if nut1 != "None" else "",
-                        "Amount 1 (ml/L)": amt1,
-                        "Nutrient 2": extra.get("nut2", ""), "Amount 2 (ml/L)": extra.get("amt2", 0),
-                        "Nutrient 3": extra.get("nut3", ""), "Amount 3 (ml/L)": extra.get("amt3", 0),
-                        "Nutrient 4": extra.get("nut4", ""), "Amount 4 (ml/L)": extra.get("amt4", 0),
-                        "Nutrient 5": extra.get("nut5", ""), "Amount 5 (ml/L)": extra.get("amt5", 0),
-                        "Notes": notes
-                    }
-                    st.session_state.feeding = pd.concat([st.session_state.feeding, pd.DataFrame([row])], ignore_index=True)
-                    st.success(f"Feeding recorded for {len(final_plants)} plant(s)!")
-                    st.rerun()
-
-    with tab2:
-        if len(st.session_state.feeding) > 0:
-            display_df = st.session_state.feeding.sort_values("Date", ascending=False)
-            st.dataframe(display_df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No feeding records yet")
-
-elif page == "Export to Excel":
-    st.title("Export to Excel")
-    if st.button("Generate Excel File", type="primary"):
-        buf = export_to_excel()
-        st.download_button("DOWNLOAD NOW", buf, f"Cannabis_Grow_Tracker_{date.today()}.xlsx",
-                           "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-        st.success("File ready!")
+# Page modules are imported on first use and then stay in sys.modules
+recorder.label(page)
+with section(f"page: {page}"):
+    importlib.import_module(f"views.{PAGES[page][1]}").render(store)
 
 # ===================== FOOTER =====================
 # === FINAL FOOTER WITH EMOJIS – GUARANTEED TO SHOW ===
-st.markdown("---")
-col1, col2, col3, col4, col5 = st.columns(5)
+with section("footer"):
+    st.markdown("---")
+    col1, col2, col3, col4, col5 = st.columns(5)
 
-with col1:
-    st.markdown("<div style='text-align:center'>🌱<br><b>Plants</b><br>{}</div>".format(len(st.session_state.plants)), unsafe_allow_html=True)
-with col2:
-    st.markdown("<div style='text-align:center'>🧬<br><b>Strains</b><br>{}</div>".format(len(st.session_state.strains)), unsafe_allow_html=True)
-with col3:
-    st.markdown("<div style='text-align:center'>💰<br><b>Expenses</b><br>{}</div>".format(len(st.session_state.expenses)), unsafe_allow_html=True)
-with col4:
-    st.markdown("<div style='text-align:center'>💵<br><b>Income</b><br>{}</div>".format(len(st.session_state.income)), unsafe_allow_html=True)
-with col5:
-    st.markdown("<div style='text-align:center'>📦<br><b>Stock</b><br>{}</div>".format(len(st.session_state.stock)), unsafe_allow_html=True)
+    with col1:
+        st.markdown("<div style='text-align:center'>🌱<br><b>Plants</b><br>{}</div>".format(store.count("plants")), unsafe_allow_html=True)
+    with col2:
+        st.markdown("<div style='text-align:center'>🧬<br><b>Strains</b><br>{}</div>".format(store.count("strains")), unsafe_allow_html=True)
+    with col3:
+        st.markdown("<div style='text-align:center'>💰<br><b>Expenses</b><br>{}</div>".format(store.count("expenses")), unsafe_allow_html=True)
+    with col4:
+        st.markdown("<div style='text-align:center'>💵<br><b>Income</b><br>{}</div>".format(store.count("income")), unsafe_allow_html=True)
+    with col5:
+        st.markdown("<div style='text-align:center'>📦<br><b>Seeds</b><br>{}</div>".format(store.seeds_on_hand()), unsafe_allow_html=True)
+
+# ===================== PERFORMANCE (ADMINS ONLY) =====================
+if st.session_state.user in ADMINS:
+    from views.performance import render_panel
+    render_panel()
+
+recorder.finish()
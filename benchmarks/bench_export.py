@@ -0,0 +1,52 @@
+# ===================== EXPORT BENCHMARK =====================
+# Compares the streaming (write-only) export with the original in-memory
+# workbook. Every case runs in its own subprocess so peak RSS is per case.
+#
+#   python benchmarks/bench_export.py --sizes 10000 100000 1000000
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate  # noqa: E402
+from export import export_to_excel, export_to_excel_in_memory  # noqa: E402
+from tables import TableStore  # noqa: E402
+
+MODES = {"streaming": export_to_excel, "in_memory": export_to_excel_in_memory}
+
+
+def run_case(n, mode):
+    store = TableStore(None, generate(n))
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    size = len(MODES[mode](store).getvalue())
+    elapsed = time.perf_counter() - t0
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"bench": "export", "mode": mode, "rows": n, "seconds": round(elapsed, 3),
+            "peak_rss_growth_mb": round((after - before) / 1024, 1), "bytes": size}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--case", nargs=2, metavar=("ROWS", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(int(args.case[0]), args.case[1])))
+        return
+    for n in args.sizes:
+        for mode in args.modes:
+            out = subprocess.run([sys.executable, __file__, "--case", str(n), mode],
+                                 capture_output=True, text=True, check=True)
+            print(out.stdout.strip(), flush=True)
+
+
+if __name__ == "__main__":
+    main()
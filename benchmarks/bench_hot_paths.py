@@ -0,0 +1,194 @@
+# ===================== HOT PATH BENCHMARKS =====================
+# Times the work behind each page on synthetic tables of growing size.
+# Every result is a JSON line; --output also writes them to one JSON file
+# (with the versions they ran on) and --baseline compares against such a
+# file from an earlier run.
+#
+#   python -m benchmarks.bench_hot_paths --sizes 1000 10000 100000 1000000
+#   python -m benchmarks.bench_hot_paths --output new.json --baseline old.json
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import generate  # noqa: E402
+from export import export_to_excel  # noqa: E402
+from forecast import forecast  # noqa: E402
+from search import search  # noqa: E402
+from stages import STAGE_DATE_COLUMNS, get_current_stage, calculate_flowering_days, calculate_total_days  # noqa: E402
+from tables import TableStore  # noqa: E402
+
+
+# ---------- cases: each mirrors what the page does ----------
+def current_stage(frames):
+    plants = frames["plants"]
+    return lambda: get_current_stage(plants)
+
+
+def plants_tracker(frames):
+    # View Plants tab: stage for every row, day counts for one page
+    store = TableStore(None, frames)
+
+    def run():
+        df = store.read("plants")
+        df["Current Stage"] = get_current_stage(df)
+        page = df.iloc[:25]
+        page.assign(**{
+            "Flowering Days": calculate_flowering_days(page["Date Flip Flower"], page["Date Harvest"]),
+            "Total Days": calculate_total_days(page["Date Germination"], page["Date Harvest"]),
+        })
+    return run
+
+
+def plants_derived_full(frames):
+    # Day counts over the whole table (the Excel sheet does this)
+    plants = frames["plants"]
+    return lambda: plants.assign(**{
+        "Flowering Days": calculate_flowering_days(plants["Date Flip Flower"], plants["Date Harvest"]),
+        "Total Days": calculate_total_days(plants["Date Germination"], plants["Date Harvest"]),
+    })
+
+
+def _dashboard(store):
+    store.count("plants")
+    store.total("plants", "Trimmed Yield (g)")
+    store.total("expenses", "Cost (ZAR)")
+    store.total("income", "Grams Sold", weight="Price per Gram")
+
+
+def dashboard_cold(frames):
+    # First Dashboard render: totals loaded with one pass per table
+    return lambda: _dashboard(TableStore(None, frames))
+
+
+def dashboard_warm(frames):
+    store = TableStore(None, frames)
+    _dashboard(store)
+    return lambda: _dashboard(store)
+
+
+def feeding_group(frames):
+    # "Or feed a group" -> All in Flower Week
+    store = TableStore(None, frames)
+
+    def run():
+        plants = store.read("plants", ["Plant ID"] + STAGE_DATE_COLUMNS)
+        plants["Current Stage"] = get_current_stage(plants)
+        chosen = plants[plants["Current Stage"].str.startswith("Flower Week")]["Plant ID"].tolist()
+        ", ".join(chosen)
+    return run
+
+
+def harvest_forecast(frames):
+    # Harvest Forecast page on a cache miss (first view of the day)
+    store = TableStore(None, frames)
+    store.table("plants")
+    return lambda: forecast(store)
+
+
+def notes_search(frames):
+    # Sidebar search once the index is built: a common phrase and a prefix
+    store = TableStore(None, frames)
+    search(store, "warm up")
+
+    def run():
+        search(store, "pH 6.2", 10)
+        search(store, "fru", 10)
+    return run
+
+
+def export(frames):
+    store = TableStore(None, frames)
+    return lambda: export_to_excel(store)
+
+
+CASES = {
+    "get_current_stage": current_stage,
+    "plants_tracker": plants_tracker,
+    "plants_derived_full": plants_derived_full,
+    "dashboard_cold": dashboard_cold,
+    "dashboard_warm": dashboard_warm,
+    "feeding_group": feeding_group,
+    "harvest_forecast": harvest_forecast,
+    "notes_search": notes_search,
+    "export_to_excel": export,
+}
+# export is slow at scale; it only runs up to this size unless asked
+EXPORT_MAX_ROWS = 10_000
+
+
+def time_case(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"commit": commit, "python": platform.python_version(), "pandas": pd.__version__,
+            "machine": platform.machine()}
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {(r["case"], r["rows"]): r for r in json.load(f)["results"]}
+    for r in results:
+        old = baseline.get((r["case"], r["rows"]))
+        if old is None:
+            continue
+        ratio = r["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        print(json.dumps({"case": r["case"], "rows": r["rows"], "baseline_s": old["median_s"],
+                          "median_s": r["median_s"], "ratio": round(ratio, 2)}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--export-max", type=int, default=EXPORT_MAX_ROWS)
+    parser.add_argument("--output", help="write all results to this JSON file")
+    parser.add_argument("--baseline", help="compare medians with an earlier --output file")
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        t0 = time.perf_counter()
+        frames = generate(n, args.seed)
+        print(json.dumps({"generate": n, "seconds": round(time.perf_counter() - t0, 3)}), file=sys.stderr)
+        for case in args.cases:
+            if case == "export_to_excel" and n > args.export_max:
+                continue
+            fn = CASES[case](frames)
+            times = time_case(fn, 1 if case == "export_to_excel" else args.repeat)
+            result = {"case": case, "rows": n, "repeat": len(times), "min_s": round(min(times), 6),
+                      "median_s": round(statistics.median(times), 6)}
+            results.append(result)
+            print(json.dumps(result), flush=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"env": {**environment(), "seed": args.seed}, "results": results}, f, indent=1)
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
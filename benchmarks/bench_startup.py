@@ -0,0 +1,92 @@
+# ===================== STARTUP / RERUN BENCHMARK =====================
+# First paint = the first script run in a fresh process (imports, table
+# loads, render) measured with Streamlit's AppTest; rerun = the same page
+# run again in that process. Every sample is its own subprocess, so each
+# first paint really is cold. --app points at another checkout's app.py
+# to compare versions against the same seeded database.
+#
+#   python -m benchmarks.bench_startup --rows 10000
+#   git worktree add /tmp/old HEAD~1
+#   python -m benchmarks.bench_startup --app /tmp/old/app.py
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ["plotly.express", "openpyxl"]
+
+
+def seed_database(path, rows, seed=0):
+    sys.path.insert(0, ROOT)
+    from benchmarks.synthetic import generate
+    from storage import Storage
+
+    storage = Storage(path)
+    for name, df in generate(rows, seed).items():
+        storage.insert_frame(name, df)
+    storage.conn.close()
+
+
+def run_case(app, page, reruns):
+    import logging
+    from streamlit.testing.v1 import AppTest
+
+    logging.disable(logging.CRITICAL)
+    os.chdir(os.path.dirname(app))
+    at = AppTest.from_file(app, default_timeout=300)
+    at.session_state.user = "Michael"
+    at.session_state.page = page
+    t0 = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    loaded = [m for m in HEAVY if m in sys.modules]
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    return {"first_paint_s": round(first, 4), "rerun_p50_s": round(statistics.median(times), 4),
+            "heavy_modules_loaded": loaded}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--pages", nargs="+", default=["Dashboard", "Plants Tracker", "Financials"])
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--case", nargs=2, metavar=("PAGE", "RERUNS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(os.path.abspath(args.app), args.case[0], int(args.case[1]))))
+        return
+
+    db = os.path.join(tempfile.mkdtemp(), "bench.db")
+    seed_database(db, args.rows)
+    env = {**os.environ, "GROW_TRACKER_DB": db}
+    for page in args.pages:
+        samples = []
+        for _ in range(args.samples):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--app", args.app,
+                                  "--case", page, str(args.reruns)],
+                                 capture_output=True, text=True, check=True, env=env)
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        print(json.dumps({
+            "bench": "startup", "app": args.app, "page": page, "rows": args.rows,
+            "first_paint_s": statistics.median(s["first_paint_s"] for s in samples),
+            "rerun_p50_s": statistics.median(s["rerun_p50_s"] for s in samples),
+            "heavy_modules_loaded": samples[-1]["heavy_modules_loaded"],
+        }), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# ===================== SYNTHETIC GROW DATA =====================
+# Seeded generator for benchmark tables. Plants get a germ -> veg -> flip ->
+# harvest date chain that stops wherever the plant is "today", so every
+# stage shows up; ledgers, stock and feedings reference the same strains and
+# plants. `n` is the row count of the big tables (plants, expenses, income,
+# feeding events); the strain library scales more slowly and stock holds
+# one pack per strain plus a consumption per Seed-type plant.
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from schema import (VARIETIES, GENDERS, ENVIRONMENTS, PLANT_TYPES, STATUSES, KEEPER,
+                    EXPENSE_CATEGORIES, PAYMENT_METHODS, coerce_frame)
+from storage import TABLES
+
+TODAY = pd.Timestamp(date(2026, 1, 1))
+NUTRIENTS = ["CalMag Essential", "NC32", "Pot Grow", "Pot Flora", "Pot Radix", "Bio-Blend", "Carbon K"]
+BREEDERS = ["Barney's Farm", "Royal Queen", "Dutch Passion", "Seedsman", "Local"]
+
+
+def _days(rng, lo, hi, n):
+    return pd.to_timedelta(rng.integers(lo, hi, n), unit="D")
+
+
+def _strains(rng, n):
+    count = max(20, n // 50)
+    return pd.DataFrame({
+        "Strain Name": [f"Strain {i}" for i in range(count)],
+        "Breeder": rng.choice(BREEDERS, count),
+        "Variety": rng.choice(VARIETIES, count),
+        "Expected Flower Time": [f"{w} weeks" for w in rng.integers(8, 12, count)],
+        "THC %": rng.uniform(12, 28, count).round(1),
+        "Times Grown": 0,
+        "Keeper?": rng.choice(KEEPER, count),
+    })
+
+
+def _plants(rng, n, strains):
+    germ = TODAY - _days(rng, 0, 1500, n)
+    veg = germ + _days(rng, 7, 21, n)
+    flip = veg + _days(rng, 21, 60, n)
+    harvest = flip + _days(rng, 50, 80, n)
+    plants = pd.DataFrame({
+        "Plant ID": [f"P{i:07d}" for i in range(n)],
+        "Strain Name": rng.choice(strains, n),
+        "Variety": rng.choice(VARIETIES, n),
+        "Gender": rng.choice(GENDERS, n, p=[0.9, 0.07, 0.03]),
+        "Environment": rng.choice(ENVIRONMENTS, n),
+        "Type": rng.choice(PLANT_TYPES, n, p=[0.7, 0.25, 0.05]),
+        "Batch #": [f"B{b}" for b in rng.integers(0, max(1, n // 20), n)],
+        "Date Germination": germ,
+        "Date Transplant Veg": veg.where(veg <= TODAY),
+        "Date Flip Flower": flip.where(flip <= TODAY),
+        "Date Harvest": harvest.where(harvest <= TODAY),
+        "Pot Size (L)": rng.choice([11.0, 15.0, 20.0, 25.0], n),
+        "Medium": rng.choice(["Coco", "Soil", "Living soil"], n),
+        "Phenotype Notes": rng.choice(["", "frosty", "stretchy", "fruity nose"], n),
+        "Rating (1-10)": rng.integers(1, 11, n),
+        "Status": rng.choice(STATUSES, n),
+    })
+    harvested = plants["Date Harvest"].notna().to_numpy()
+    wet = np.where(harvested, rng.uniform(100, 900, n).round(1), 0.0)
+    plants["Wet Weight (g)"] = wet
+    plants["Dry Weight (g)"] = (wet * 0.25).round(1)
+    plants["Trimmed Yield (g)"] = (wet * 0.2).round(1)
+    return plants
+
+
+def _expenses(rng, n):
+    return pd.DataFrame({
+        "Date": TODAY - _days(rng, 0, 1500, n),
+        "Category": rng.choice(EXPENSE_CATEGORIES, n),
+        "Item": rng.choice(["Nutrients 1L", "LED panel", "Coco 50L", "Fabric pot", "Seeds"], n),
+        "Supplier": rng.choice(["GrowShop", "Builders", "Online"], n),
+        "Cost (ZAR)": rng.uniform(10, 4000, n).round(2),
+        "Quantity": rng.integers(1, 10, n),
+    })
+
+
+def _income(rng, n, strains):
+    return pd.DataFrame({
+        "Date": TODAY - _days(rng, 0, 1500, n),
+        "Strain": rng.choice(strains, n),
+        "Grams Sold": rng.uniform(1, 100, n).round(1),
+        "Price per Gram": rng.uniform(40, 150, n).round(2),
+        "Buyer/Channel": rng.choice(["Club", "Private", "Dispensary"], n),
+        "Payment Method": rng.choice(PAYMENT_METHODS, n),
+    })
+
+
+def _stock(rng, strains, plants):
+    # one pack received per strain, then one seed out per Seed-type plant
+    count = len(strains)
+    grown = plants[plants["Type"] == "Seed"]
+    used = grown["Strain Name"].value_counts().reindex(strains["Strain Name"], fill_value=0).to_numpy()
+    seeds = used + rng.integers(0, 20, count)
+    receipts = pd.DataFrame({
+        "Date": TODAY - pd.Timedelta(days=1600),
+        "Strain": strains["Strain Name"],
+        "Breeder": strains["Breeder"],
+        "Movement": "Receipt",
+        "Seeds": seeds,
+        "Cost (ZAR)": rng.uniform(200, 1500, count).round(2),
+    })
+    packs = receipts.set_index("Strain")
+    consumptions = pd.DataFrame({
+        "Date": grown["Date Germination"],
+        "Strain": grown["Strain Name"],
+        "Breeder": grown["Strain Name"].map(packs["Breeder"]),
+        "Movement": "Consumption",
+        "Seeds": 1,
+        "Cost (ZAR)": grown["Strain Name"].map(packs["Cost (ZAR)"] / packs["Seeds"]).round(2),
+        "Plant ID": grown["Plant ID"],
+    }).sort_values("Date", kind="stable")
+    return pd.concat([receipts, consumptions], ignore_index=True)
+
+
+def _feeding(rng, n, plants):
+    # n events, each for one to three plants with one to three nutrients
+    events = pd.DataFrame({
+        "Date": TODAY - _days(rng, 0, 1500, n),
+        "Stage": rng.choice(["Veg Week 2", "Flower Week 3", "All Plants"], n),
+        "Notes": rng.choice(["pH 6.2 EC 1.4", "pH 5.8", ""], n),
+    }, index=pd.RangeIndex(1, n + 1, name="id"))
+    plants_per = rng.integers(1, 4, n)
+    event_ids = np.repeat(events.index.to_numpy(), plants_per)
+    plant_ids = plants["Plant ID"].to_numpy()[rng.integers(0, len(plants), len(event_ids))]
+    doses_per = rng.integers(1, 4, len(event_ids))
+    dose_event = np.repeat(event_ids, doses_per)
+    # 1..k within each plant's doses
+    starts = np.repeat(np.cumsum(doses_per) - doses_per, doses_per)
+    dose_no = np.arange(len(dose_event)) - starts + 1
+    nutrients = np.asarray(NUTRIENTS)[(dose_event * 7 + dose_no) % len(NUTRIENTS)]
+    doses = pd.DataFrame({
+        "Event ID": dose_event,
+        "Date": events["Date"].to_numpy()[dose_event - 1],
+        "Plant ID": np.repeat(plant_ids, doses_per),
+        "Plant Stage": events["Stage"].to_numpy()[dose_event - 1],
+        "Dose #": dose_no,
+        "Nutrient": nutrients,
+        "Amount (ml/L)": rng.uniform(0.2, 5, len(dose_event)).round(1),
+    }, index=pd.RangeIndex(1, len(dose_event) + 1, name="id"))
+    return events, doses
+
+
+def generate(n, seed=0):
+    # {table: typed frame} for every table, ready for TableStore(None, frames)
+    rng = np.random.default_rng(seed)
+    strains = _strains(rng, n)
+    plants = _plants(rng, n, strains["Strain Name"].to_numpy())
+    feeding, doses = _feeding(rng, n, plants)
+    frames = {
+        "plants": plants,
+        "strains": strains,
+        "expenses": _expenses(rng, n),
+        "income": _income(rng, n, strains["Strain Name"].to_numpy()),
+        "stock": _stock(rng, strains, plants),
+        "feeding": feeding,
+        "feeding_doses": doses,
+    }
+    out = {}
+    for name, df in frames.items():
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 1:
+            df.index = pd.RangeIndex(1, len(df) + 1, name="id")
+        out[name] = coerce_frame(name, df.reindex(columns=TABLES[name]))
+    return out
@@ -0,0 +1,37 @@
+# ===================== STATIC CONFIGURATION =====================
+# Logins, navigation and form catalogs. Imported once per server process,
+# so none of this is rebuilt on a rerun.
+
+# ← add as many users as you want here
+VALID_USERS = {
+    "Michael": "KATVIS",
+    "Fanie":   "Zgtr2gn8Q4JteNa",
+    # add more lines like this ↓
+    # "sarah":   "herpassword",
+}
+# users who see the Performance panel
+ADMINS = {"Michael"}
+
+# page name -> (sidebar emoji, module in views/ that renders it)
+PAGES = {
+    "Dashboard": ("🏠", "dashboard"),
+    "Financials": ("📈", "financials"),
+    "Plants Tracker": ("🌱", "plants"),
+    "Harvest Forecast": ("🗓", "forecast"),
+    "Strains Library": ("🧬", "strains"),
+    "Expenses": ("💰", "expenses"),
+    "Income": ("💵", "income"),
+    "Seed Stock": ("📦", "seed_stock"),
+    "Feeding Schedule": ("🍽", "feeding_schedule"),
+    "Import": ("📥", "import_data"),
+    "Export to Excel": ("📊", "export_excel"),
+}
+
+NUTRIENTS = [
+    "CalMag Essential", "NC32", "Pot Grow", "Pot Flora",
+    "Pot Radix", "Bio-Blend", "Carbon K", "Multi Foliar Spray Concentrate",
+    "Other (type below)"
+]
+FEED_GROUPS = ["None", "All Plants", "All in Germ Week", "All in Veg Week", "All in Flower Week"]
+STRAIN_VARIETIES = ["Sativa", "Indica", "Hybrid", "Autoflower"]
+INCOME_SOURCES = ["Harvest Sale", "Clone Sale", "Capital Invested", "Other"]
@@ -0,0 +1,154 @@
+import io
+from collections import OrderedDict
+
+from openpyxl import Workbook
+from pandas.api.types import is_datetime64_any_dtype
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment
+
+from feeding import wide_schedule
+from instrumentation import timed
+from seed_ledger import seed_ledger
+from stages import calculate_flowering_days, calculate_total_days
+from strain_stats import strain_library
+
+# ===================== EXCEL EXPORT =====================
+SHEETS = [
+    ("Expenses", "expenses"),
+    ("Income", "income"),
+    ("Seed Stock", "stock"),
+]
+
+CHUNK_ROWS = 5000
+
+
+def dashboard_rows(store):
+    total_expenses = store.total("expenses", "Cost (ZAR)")
+    total_income = store.total("income", "Grams Sold", weight="Price per Gram")
+    yield ["Cannabis Grow Tracker - Summary"]
+    yield ["Total Plants", store.count("plants")]
+    yield ["Total Yield (g)", store.total("plants", "Trimmed Yield (g)")]
+    yield ["Total Expenses", total_expenses]
+    yield ["Total Income", total_income]
+    yield ["Net Profit", total_income - total_expenses]
+
+
+def plants_sheet(store):
+    df = store.read("plants")
+    return df.assign(**{
+        "Flowering Days": calculate_flowering_days(df["Date Flip Flower"], df["Date Harvest"]),
+        "Total Days": calculate_total_days(df["Date Germination"], df["Date Harvest"]),
+    })
+
+
+def sheet_frames(store):
+    yield "Plants Tracker", plants_sheet(store)
+    yield "Strains Library", strain_library(store)
+    yield "Harvest Forecast", store.forecast()
+    for name, table in SHEETS:
+        yield name, store.read(table)
+    with store.lock:
+        balances = seed_ledger(store).balance_frame()
+    yield "Seed Balances", balances
+    yield "Feeding Schedule", wide_schedule(store)
+
+
+def cell_values(df):
+    # Excel gets plain dates and None instead of Timestamps and NaN/NaT/<NA>
+    df = df.assign(**{c: df[c].dt.date for c in df.columns if is_datetime64_any_dtype(df[c])}).astype(object)
+    return df.where(df.notna(), None)
+
+
+def frame_rows(df, chunk_rows=CHUNK_ROWS):
+    # Converts one slice at a time so only a chunk of Python objects is alive
+    for start in range(0, len(df), chunk_rows):
+        yield from cell_values(df.iloc[start:start + chunk_rows]).itertuples(index=False, name=None)
+
+
+@timed()
+def export_to_excel(store):
+    # Write-only workbook: rows are streamed to disk as they are appended
+    wb = Workbook(write_only=True)
+    bold, center = Font(bold=True), Alignment(horizontal="center")
+
+    def header(ws, headers):
+        cells = []
+        for h in headers:
+            cell = WriteOnlyCell(ws, value=h)
+            cell.font, cell.alignment = bold, center
+            cells.append(cell)
+        return cells
+
+    ws = wb.create_sheet("Dashboard")
+    for row in dashboard_rows(store):
+        ws.append(row)
+
+    for name, df in sheet_frames(store):
+        ws = wb.create_sheet(name)
+        ws.append(header(ws, df.columns.tolist()))
+        for row in frame_rows(df):
+            ws.append(row)
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def export_to_excel_in_memory(store):
+    # Original full-workbook path, kept for comparison in benchmarks
+    wb = Workbook()
+    wb.remove(wb.active)
+
+    def header(ws, headers):
+        for c, h in enumerate(headers, 1):
+            cell = ws.cell(1, c, h)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal="center")
+
+    ws = wb.create_sheet("Dashboard")
+    for row in dashboard_rows(store):
+        ws.append(row)
+
+    for name, df in sheet_frames(store):
+        ws = wb.create_sheet(name)
+        header(ws, df.columns.tolist())
+        for r in cell_values(df).itertuples(index=False):
+            ws.append(list(r))
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+# ===================== EXPORT CACHE =====================
+class ExportCache:
+    # Finished (or running) builds keyed on the store's data version, so an
+    # unchanged store downloads the bytes that were already built.
+    def __init__(self, executor, max_entries=4):
+        self.executor = executor
+        self.max_entries = max_entries
+        self._jobs = OrderedDict()
+
+    def get(self, store):
+        key = store.data_version()
+        job = self._jobs.get(key)
+        if job is not None:
+            self._jobs.move_to_end(key)
+        return job
+
+    def submit(self, store):
+        # version and snapshot read together, so the bytes match their key
+        with store.lock:
+            key = store.data_version()
+            job = self._jobs.get(key)
+            if job is not None and not (job.done() and job.exception() is not None):
+                self._jobs.move_to_end(key)
+                return job
+            snapshot = store.snapshot()
+        job = self.executor.submit(lambda snap: export_to_excel(snap).getvalue(), snapshot)
+        self._jobs[key] = job
+        while len(self._jobs) > self.max_entries:
+            self._jobs.popitem(last=False)
+        return job
@@ -0,0 +1,159 @@
+from collections import defaultdict
+
+import pandas as pd
+
+from analytics import bucket_starts
+from instrumentation import timed
+from storage import WIDE_FEEDING_COLUMNS
+
+# ===================== FEEDING LOG =====================
+# Feedings are stored long-form: one "feeding" event row plus one
+# "feeding_doses" row per plant x nutrient. FeedingIndex keeps a per-plant
+# list of dose ids and running ml/L totals per plant and per week, so plant
+# history and usage questions never scan the whole log.
+
+MAX_DOSES = 5
+
+
+class FeedingIndex:
+    def __init__(self):
+        self.by_plant = defaultdict(list)   # Plant ID -> dose row ids
+        self.totals = defaultdict(float)    # (Plant ID, Nutrient) -> ml/L
+        self.weekly = defaultdict(float)    # (week start, Nutrient) -> ml/L
+        self._wide = (None, None)
+
+    def load(self, name, df):
+        if name != "feeding_doses":
+            return
+        self.by_plant.clear()
+        self.totals.clear()
+        self.weekly.clear()
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name != "feeding_doses" or len(df) == 0:
+            return
+        for plant, ids in df.groupby("Plant ID", sort=False).groups.items():
+            self.by_plant[plant].extend(ids)
+        amounts = df["Amount (ml/L)"].astype("float64").fillna(0.0)
+        for key, v in amounts.groupby([df["Plant ID"], df["Nutrient"]]).sum().items():
+            self.totals[key] += v
+        _, week = bucket_starts(df["Date"])
+        week.index = df.index
+        for key, v in amounts.groupby([week, df["Nutrient"]]).sum().items():
+            self.weekly[key] += v
+
+    def _apply(self, row, sign):
+        amount = float(row.get("Amount (ml/L)") or 0.0)
+        if pd.isna(amount):
+            return
+        self.totals[(row.get("Plant ID"), row.get("Nutrient"))] += sign * amount
+        _, week = bucket_starts([row.get("Date")])
+        if pd.notna(week.iloc[0]):
+            self.weekly[(week.iloc[0], row.get("Nutrient"))] += sign * amount
+
+    def on_insert(self, name, row_id, row):
+        if name == "feeding_doses":
+            self.by_plant[row.get("Plant ID")].append(row_id)
+            self._apply(row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        if name == "feeding_doses":
+            self.on_delete(name, row_id, old)
+            self.on_insert(name, row_id, new)
+
+    def on_delete(self, name, row_id, row):
+        if name == "feeding_doses":
+            self.by_plant[row.get("Plant ID")].remove(row_id)
+            self._apply(row, -1)
+
+
+def feeding_index(store):
+    store.table("feeding")
+    store.table("feeding_doses")
+    return store.feeding
+
+
+# ===================== WRITES =====================
+@timed()
+def record_feeding(store, feed_date, stage, plant_stages, doses, notes=""):
+    # plant_stages: {Plant ID: current stage}; doses: [(nutrient, ml/L), ...]
+    # one transaction, so an event is never left without its doses
+    with store.batch():
+        event_id = store.insert("feeding", {"Date": feed_date, "Stage": stage, "Notes": notes})
+        store.insert_many("feeding_doses", [
+            {"Event ID": event_id, "Date": feed_date, "Plant ID": plant, "Plant Stage": plant_stage,
+             "Dose #": i, "Nutrient": nutrient, "Amount (ml/L)": amount}
+            for plant, plant_stage in plant_stages.items()
+            for i, (nutrient, amount) in enumerate(doses[:MAX_DOSES], 1)
+        ])
+    return event_id
+
+
+# ===================== QUERIES =====================
+def plant_history(store, plant_id):
+    index = feeding_index(store)
+    with store.lock:
+        doses = store.table("feeding_doses").frame.loc[list(index.by_plant.get(plant_id, []))]
+    notes = store.table("feeding").frame["Notes"]
+    history = doses.drop(columns=["Plant ID"]).assign(Notes=notes.reindex(doses["Event ID"]).to_numpy())
+    return history.sort_values(["Date", "Event ID", "Dose #"], ascending=[False, False, True])
+
+
+@timed()
+def nutrient_totals(store, plant_ids=None):
+    # Cumulative ml/L per nutrient over the given plants (a grow), or all plants
+    index = feeding_index(store)
+    wanted = None if plant_ids is None else set(plant_ids)
+    totals = defaultdict(float)
+    with store.lock:
+        items = list(index.totals.items())
+    for (plant, nutrient), v in items:
+        if wanted is None or plant in wanted:
+            totals[nutrient] += v
+    s = pd.Series(totals, dtype=float, name="Total (ml/L)")
+    return s[s.abs() > 1e-9].round(3).sort_values(ascending=False).rename_axis("Nutrient")
+
+
+@timed()
+def weekly_usage(store):
+    index = feeding_index(store)
+    with store.lock:
+        s = pd.Series(dict(index.weekly), dtype=float)
+    if s.empty:
+        return pd.DataFrame()
+    df = s.unstack(fill_value=0.0).sort_index()
+    df.index.name = "Week"
+    return df.loc[:, df.abs().sum() > 1e-9].round(3)
+
+
+@timed()
+def wide_schedule(store):
+    # The original one-row-per-feeding layout, rebuilt from the long form
+    with store.lock:
+        events = store.table("feeding")
+        doses = store.table("feeding_doses")
+        index = feeding_index(store)
+        key = (events.version, doses.version, len(events), len(doses))
+        if index._wide[0] == key:
+            return index._wide[1]
+        ev, ds = events.frame, doses.frame
+    wide = pd.DataFrame(index=ev.index)
+    wide["Date"] = ev["Date"]
+    pairs = ds.drop_duplicates(["Event ID", "Plant ID"])
+    joined = defaultdict(list)
+    for event_id, plant in zip(pairs["Event ID"].to_numpy(), pairs["Plant ID"].astype(str).to_numpy()):
+        joined[event_id].append(plant)
+    plants = pd.Series({event_id: ", ".join(ids) for event_id, ids in joined.items()}, dtype=object)
+    wide["Plant ID(s)"] = plants.reindex(ev.index).to_numpy()
+    wide["Stage"] = ev["Stage"]
+    slots = ds.drop_duplicates(["Event ID", "Dose #"]).set_index(["Event ID", "Dose #"])
+    for i in range(1, MAX_DOSES + 1):
+        slot = slots.xs(i, level="Dose #") if i in slots.index.get_level_values("Dose #") else slots.iloc[:0].droplevel(1)
+        wide[f"Nutrient {i}"] = slot["Nutrient"].reindex(ev.index).to_numpy()
+        wide[f"Amount {i} (ml/L)"] = slot["Amount (ml/L)"].reindex(ev.index).to_numpy()
+    wide["Notes"] = ev["Notes"]
+    wide["Created By"] = ev["Created By"]
+    wide = wide[WIDE_FEEDING_COLUMNS]
+    index._wide = (key, wide)
+    return wide
@@ -0,0 +1,149 @@
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import timed
+from keys import strain_keys
+from stages import get_current_stage, parse_dates, today_ts
+
+# ===================== HARVEST FORECAST =====================
+# Projected harvest date and yield for every plant that is still growing.
+# Per strain, flowering days and yield are past grows blended with a prior:
+# the strain's Expected Flower Time (else the all-strain average) counts as
+# PRIOR_WEIGHT plants, so one odd harvest doesn't swing a strain's forecast
+# and strains with no history fall back to the prior. The strain parameters
+# are worked out once (a few hundred rows) and mapped onto all active plants
+# with array ops.
+#
+# A plant without a flip date gets one projected from its transplant or
+# germination date. A Date Harvest still in the future is taken as planned.
+# Plants past their projected date are due today and flagged Overdue.
+
+PRIOR_WEIGHT = 3
+DEFAULT_FLOWER_DAYS = 63
+VEG_DAYS = 28
+SEEDLING_DAYS = 14
+DONE = ["Drying", "Cured", "Sold", "Gifted", "Lost"]
+
+
+def flower_time_days(text):
+    # "9", "8-9 weeks", "60-65 days" -> days; None if there's no number
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return None
+    numbers = [float(n) for n in re.findall(r"\d+(?:\.\d+)?", str(text))]
+    if not numbers:
+        return None
+    value = sum(numbers) / len(numbers)
+    return value if "day" in str(text).lower() else value * 7
+
+
+def strain_parameters(strains, sums):
+    # Flower days and yield per strain key, blended with the prior
+    expected = {}
+    for key, text in zip(strain_keys(strains["Strain Name"]).tolist(), strains["Expected Flower Time"].tolist()):
+        days = flower_time_days(text)
+        if not pd.isna(key) and days is not None:
+            expected[key] = days
+
+    keys = sorted(set(sums) | set(expected))
+    totals = np.array([sums.get(k, (0, 0, 0.0, 0, 0, 0, 0.0)) for k in keys], dtype="float64").reshape(-1, 7)
+    harvested, grams, flowered, days = totals[:, 1], totals[:, 2], totals[:, 3], totals[:, 4]
+    all_days = days.sum() / flowered.sum() if flowered.sum() else DEFAULT_FLOWER_DAYS
+    all_yield = grams.sum() / harvested.sum() if harvested.sum() else np.nan
+
+    prior_days = np.array([expected.get(k, all_days) for k in keys], dtype="float64")
+    return pd.DataFrame({
+        "flower_days": (days + PRIOR_WEIGHT * prior_days) / (flowered + PRIOR_WEIGHT),
+        "yield": (grams + PRIOR_WEIGHT * all_yield) / (harvested + PRIOR_WEIGHT),
+        "history": flowered.astype("int64"),
+    }, index=pd.Index(keys, dtype=object)), all_days, all_yield
+
+
+@timed()
+def forecast(store, today=None):
+    today = today_ts(today)
+    plants = store.read("plants")
+    strains = store.read("strains")
+    with store.lock:
+        store.table("plants")
+        params, all_days, all_yield = strain_parameters(strains, dict(store.strain_stats.sums))
+
+    harvest = parse_dates(plants["Date Harvest"])
+    active = (harvest.isna() | (harvest > today)).to_numpy() & ~plants["Status"].isin(DONE).to_numpy()
+    plants, harvest = plants[active], harvest[active]
+
+    # strain parameters onto plants by position
+    keys = strain_keys(plants["Strain Name"])
+    at = params.index.get_indexer(keys.astype(object))
+    known = at >= 0
+    flower_days = np.where(known, params["flower_days"].to_numpy()[at], all_days)
+    grams = np.where(known, params["yield"].to_numpy()[at], all_yield)
+    history = np.where(known, params["history"].to_numpy()[at], 0)
+
+    flip = parse_dates(plants["Date Flip Flower"])
+    estimated_flip = (parse_dates(plants["Date Transplant Veg"]) + pd.Timedelta(days=VEG_DAYS)).fillna(
+        parse_dates(plants["Date Germination"]) + pd.Timedelta(days=SEEDLING_DAYS + VEG_DAYS))
+    flip_estimated = flip.isna() & estimated_flip.notna()
+    flip = flip.fillna(estimated_flip)
+
+    projected = flip + pd.to_timedelta(np.round(flower_days), unit="D")
+    projected = projected.where(harvest.isna(), harvest)
+    overdue = (projected < today).to_numpy()
+    projected = projected.where(~overdue, today)
+
+    out = pd.DataFrame({
+        "Plant ID": plants["Plant ID"],
+        "Strain Name": plants["Strain Name"],
+        "Current Stage": get_current_stage(plants, today),
+        "Flip Date": flip,
+        "Flip Estimated": flip_estimated,
+        "Projected Harvest": projected,
+        "Days Left": (projected - today).dt.days.astype("Int32"),
+        "Overdue": overdue,
+        "Flower Days Used": np.round(flower_days).astype("int64"),
+        "Expected Yield (g)": np.round(grams, 1),
+        "Strain History (plants)": history.astype("int64"),
+    }, index=plants.index)
+    # no date to project from at all
+    return out[out["Projected Harvest"].notna()].sort_values("Projected Harvest", kind="stable")
+
+
+def weekly_projection(df):
+    # Plants due and projected grams per week (weeks start on Monday)
+    dates = df["Projected Harvest"]
+    week = dates - pd.to_timedelta(dates.dt.weekday, unit="D")
+    out = df.groupby(week).agg(**{"Plants": ("Plant ID", "size"), "Projected Grams": ("Expected Yield (g)", "sum")})
+    return out.rename_axis("Week Starting").reset_index()
+
+
+def calendar_month(df, month):
+    # Harvests due per day of one month as a week x weekday grid of "n (g)"
+    start = pd.Timestamp(month).to_period("M").start_time
+    days = pd.date_range(start, start + pd.offsets.MonthEnd(0))
+    dates = df["Projected Harvest"]
+    due = df[(dates >= days[0]) & (dates <= days[-1])].groupby("Projected Harvest").agg(
+        n=("Plant ID", "size"), g=("Expected Yield (g)", "sum")).reindex(days)
+    labels = [f"{d.day}: {int(n)} ({g:,.0f} g)" if pd.notna(n) else str(d.day)
+              for d, n, g in zip(days, due["n"], due["g"])]
+    cells = [""] * days[0].weekday() + labels
+    cells += [""] * (-len(cells) % 7)
+    return pd.DataFrame(np.array(cells).reshape(-1, 7), columns=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+
+
+class ForecastCache:
+    # The last forecast, reused until the day changes or plants / strains
+    # are written; stages only move once a day.
+    def __init__(self):
+        self._key = None
+        self._frame = None
+        self._lock = threading.Lock()
+
+    def get(self, store, today=None):
+        today = today_ts(today)
+        key = (today, store.table("plants").version, store.table("strains").version)
+        with self._lock:
+            if key != self._key:
+                self._frame, self._key = forecast(store, today), key
+            return self._frame
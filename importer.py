@@ -0,0 +1,222 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from feeding import MAX_DOSES
+from instrumentation import timed
+from schema import SCHEMA, DATE, coerce_column, coerce_frame
+from seed_ledger import consume_seeds
+from storage import TABLES, WIDE_FEEDING_COLUMNS
+
+# ===================== BULK IMPORT =====================
+# CSV / XLSX files are read in chunks. Each chunk is validated a column at a
+# time (required fields, dates, enums, non-negative numbers) and the rows
+# that pass go to the store in one write. Workbooks produced by
+# export_to_excel can be imported whole: every sheet maps back to its table.
+#
+# Imported Seed-type plants book a seed out of stock like the Add Plant form
+# does, unless the ledger already has one for them. Workbooks import their
+# Seed Stock sheet first, so an exported ledger isn't booked twice.
+
+CHUNK_ROWS = 50_000
+
+# Sheet names used by export_to_excel
+SHEET_TABLES = {
+    "Plants Tracker": "plants",
+    "Strains Library": "strains",
+    "Expenses": "expenses",
+    "Income": "income",
+    "Seed Stock": "stock",
+    "Feeding Schedule": "feeding",
+}
+
+REQUIRED = {
+    "plants": ["Plant ID", "Strain Name"],
+    "strains": ["Strain Name"],
+    "expenses": ["Date", "Item"],
+    "income": ["Date"],
+    "stock": ["Strain"],
+    "feeding": ["Date", "Plant ID(s)"],
+}
+
+# columns of older exports, renamed on import
+RENAMED = {
+    "stock": {"Seeds Left": "Seeds", "Pack Cost (ZAR)": "Cost (ZAR)"},
+}
+
+FEEDING_SCHEMA = {"Date": DATE, **{f"Amount {i} (ml/L)": "float32" for i in range(1, MAX_DOSES + 1)}}
+
+
+def import_columns(table):
+    return WIDE_FEEDING_COLUMNS if table == "feeding" else TABLES[table]
+
+
+def _blank(series):
+    return series.isna().to_numpy() | (series.astype(str).str.strip() == "").to_numpy()
+
+
+def _strip(series):
+    if pd.api.types.is_string_dtype(series) and not series.dtype == object:
+        return series.str.strip()
+    if series.dtype == object:
+        return series.map(lambda v: v.strip() if isinstance(v, str) else v)
+    return series
+
+
+def validate(table, raw):
+    # Returns (clean frame, rejected rows with a Reason column)
+    raw = raw.rename(columns=RENAMED.get(table, {})).reindex(columns=import_columns(table))
+    if table == "stock":
+        # the old Seed Stock sheet had no Movement: every row is stock received
+        raw["Movement"] = raw["Movement"].where(~_blank(raw["Movement"]), "Receipt")
+    raw = raw.apply(_strip)
+    reasons = np.full(len(raw), "", dtype=object)
+
+    def reject(mask, reason):
+        reasons[mask] = np.where(reasons[mask] == "", reason, reasons[mask] + "; " + reason)
+
+    for col in REQUIRED[table]:
+        reject(_blank(raw[col]), f"missing {col}")
+
+    schema = FEEDING_SCHEMA if table == "feeding" else SCHEMA[table]
+    coerced = {}
+    for col, dtype in schema.items():
+        values = coerce_column(raw[col], dtype)
+        bad = ~_blank(raw[col]) & values.isna().to_numpy()
+        if isinstance(dtype, CategoricalDtype):
+            reject(bad, f"unknown {col}")
+        elif dtype == DATE:
+            reject(bad, f"bad {col}")
+        else:
+            out_of_range = bad & pd.to_numeric(raw[col], errors="coerce").notna().to_numpy()
+            reject(out_of_range, f"{col} out of range")
+            reject(bad & ~out_of_range, f"{col} not a number")
+            reject((values < 0).fillna(False).to_numpy(), f"negative {col}")
+        coerced[col] = values
+
+    ok = reasons == ""
+    clean = raw.assign(**coerced)[ok]
+    rejected = raw[~ok].assign(Reason=reasons[~ok])
+    return clean, rejected
+
+
+def _commit_feeding(store, wide):
+    # Wide "Feeding Schedule" rows -> feeding events + one dose per plant x slot
+    event_ids = store.insert_frame("feeding", wide[["Date", "Stage", "Notes", "Created By"]])
+    wide = wide.assign(**{"Event ID": np.asarray(event_ids)})
+    wide["Plant ID"] = wide["Plant ID(s)"].astype(str).str.split(",")
+    per_plant = wide.explode("Plant ID")
+    per_plant["Plant ID"] = per_plant["Plant ID"].str.strip()
+    per_plant = per_plant[per_plant["Plant ID"] != ""]
+    slots = []
+    for i in range(1, MAX_DOSES + 1):
+        nutrient = per_plant[f"Nutrient {i}"]
+        has = ~_blank(nutrient)
+        slots.append(pd.DataFrame({
+            "Event ID": per_plant["Event ID"][has], "Date": per_plant["Date"][has],
+            "Plant ID": per_plant["Plant ID"][has], "Plant Stage": None, "Dose #": i,
+            "Nutrient": nutrient[has], "Amount (ml/L)": per_plant[f"Amount {i} (ml/L)"][has],
+            "Created By": per_plant["Created By"][has],
+        }))
+    doses = pd.concat(slots, ignore_index=True).sort_values(["Event ID", "Plant ID", "Dose #"], kind="stable")
+    store.insert_frame("feeding_doses", doses)
+
+
+def commit(store, table, clean):
+    # Returns (seeds booked out, seed plants with no stock)
+    if len(clean) == 0:
+        return 0, 0
+    if table == "feeding":
+        with store.batch():
+            _commit_feeding(store, clean)
+    elif table == "plants":
+        with store.batch():
+            store.insert_frame(table, coerce_frame(table, clean))
+            return consume_seeds(store, clean)
+    else:
+        store.insert_frame(table, coerce_frame(table, clean))
+    return 0, 0
+
+
+# ===================== READERS =====================
+def _csv_chunks(source, chunk_rows):
+    yield from pd.read_csv(source, dtype=str, chunksize=chunk_rows, skipinitialspace=True)
+
+
+def _sheet_chunks(ws, chunk_rows):
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return
+    header = [str(h).strip() if h is not None else "" for h in header]
+    width = len(header)
+    batch = []
+    for row in rows:
+        # streamed workbooks carry no dimensions, so rows can come back ragged
+        if any(v is not None and v != "" for v in row):
+            batch.append((tuple(row) + (None,) * width)[:width])
+        if len(batch) >= chunk_rows:
+            yield pd.DataFrame(batch, columns=header, dtype=object)
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, columns=header, dtype=object)
+
+
+class ImportReport:
+    def __init__(self, table):
+        self.table = table
+        self.accepted = 0
+        self.rejected = []
+        self.seeds_booked = 0
+        self.seeds_missing = 0
+
+    @property
+    def rejected_rows(self):
+        return pd.concat(self.rejected, ignore_index=True) if self.rejected else pd.DataFrame()
+
+    @property
+    def rejected_count(self):
+        return sum(len(r) for r in self.rejected)
+
+
+def import_chunks(store, table, chunks, progress=None):
+    report = ImportReport(table)
+    for chunk in chunks:
+        clean, rejected = validate(table, chunk)
+        booked, missing = commit(store, table, clean)
+        report.accepted += len(clean)
+        report.seeds_booked += booked
+        report.seeds_missing += missing
+        if len(rejected):
+            report.rejected.append(rejected)
+        if progress is not None:
+            progress(report)
+    return report
+
+
+@timed()
+def import_file(store, source, table=None, filename=None, chunk_rows=CHUNK_ROWS, progress=None):
+    # CSV needs a table; an XLSX imports every sheet whose name (or the
+    # given table) it recognises. Returns one ImportReport per table.
+    filename = filename or getattr(source, "name", "") or (source if isinstance(source, str) else "")
+    if os.path.splitext(str(filename))[1].lower() in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+        data = source if isinstance(source, str) else io.BytesIO(source.read())
+        wb = load_workbook(data, read_only=True, data_only=True)
+        try:
+            reports = []
+            # stock before plants: seed plants draw on it
+            for ws in sorted(wb.worksheets, key=lambda ws: SHEET_TABLES.get(ws.title) != "stock"):
+                sheet_table = SHEET_TABLES.get(ws.title) or (table if len(wb.worksheets) == 1 else None)
+                if sheet_table is None or (table is not None and sheet_table != table):
+                    continue
+                reports.append(import_chunks(store, sheet_table, _sheet_chunks(ws, chunk_rows), progress))
+            return reports
+        finally:
+            wb.close()
+    if table is None:
+        raise ValueError("Pick which table a CSV file belongs to")
+    return [import_chunks(store, table, _csv_chunks(source, chunk_rows), progress)]
@@ -0,0 +1,186 @@
+import cProfile
+import functools
+import io
+import marshal
+import os
+import pickle
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# ===================== INSTRUMENTATION =====================
+# Opt-in timing for reruns. The app opens a rerun with begin(), wraps its
+# blocks in section(...) and closes it with finish(); helpers are wrapped
+# with @timed. A section that exits through st.stop() / st.rerun() closes
+# the rerun as well, so interrupted reruns are still counted. Finished
+# reruns go into a ring buffer shared by all sessions; with recording off
+# every hook is a single flag check.
+#
+# Profiling is separate and heavier: while it is on, each rerun also runs
+# under cProfile or tracemalloc and the last N results are kept for a dump.
+
+CAPACITY = 500
+PROFILERS = ["Off", "cProfile", "tracemalloc"]
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Recorder:
+    def __init__(self, capacity=CAPACITY, enabled=False):
+        self.enabled = enabled
+        self.runs = deque(maxlen=capacity)
+        self.profiler = "Off"
+        self.profiles = deque(maxlen=10)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    # ---------- reruns ----------
+    def begin(self, label=""):
+        if not self.enabled:
+            self._local.run = None
+            return
+        run = {"label": label, "started": time.time(), "t0": time.perf_counter(),
+               "rss_before": _rss_mb(), "sections": {}, "profile": None}
+        if self.profiler == "cProfile":
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                run["profile"] = profile
+            except ValueError:
+                pass  # another session's rerun is being profiled right now
+        elif self.profiler == "tracemalloc":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+            tracemalloc.reset_peak()
+            run["profile"] = "tracemalloc"
+        self._local.run = run
+
+    def finish(self, outcome="ok"):
+        run = getattr(self._local, "run", None)
+        if run is None:
+            return
+        self._local.run = None
+        seconds = time.perf_counter() - run.pop("t0")
+        profile = run.pop("profile")
+        # a rerun that started before the profiler was switched is dropped
+        if isinstance(profile, cProfile.Profile):
+            profile.disable()
+            if self.profiler == "cProfile":
+                self.profiles.append((run["started"], profile))
+        elif profile == "tracemalloc" and self.profiler == "tracemalloc" and tracemalloc.is_tracing():
+            run["traced_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+            self.profiles.append((run["started"], tracemalloc.take_snapshot()))
+        rss = _rss_mb()
+        run.update(outcome=outcome, seconds=seconds, rss_mb=rss, rss_delta_mb=rss - run.pop("rss_before"))
+        with self._lock:
+            self.runs.append(run)
+
+    def label(self, label):
+        run = getattr(self._local, "run", None)
+        if run is not None:
+            run["label"] = label
+
+    # ---------- sections ----------
+    @contextmanager
+    def section(self, name):
+        run = getattr(self._local, "run", None)
+        if run is None:
+            yield
+            return
+        t0 = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._add(run, name, time.perf_counter() - t0)
+            # st.stop() / st.rerun() end the script here
+            self.finish(type(e).__name__)
+            raise
+        self._add(run, name, time.perf_counter() - t0)
+
+    def _add(self, run, name, seconds):
+        run["sections"][name] = run["sections"].get(name, 0.0) + seconds
+
+    def timed(self, name=None):
+        def decorate(fn):
+            key = name or fn.__name__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                run = getattr(self._local, "run", None)
+                if run is None:
+                    return fn(*args, **kwargs)
+                t0 = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._add(run, key, time.perf_counter() - t0)
+            return wrapper
+        return decorate
+
+    # ---------- reporting ----------
+    def stats(self):
+        # p50 / p95 per section over the buffered reruns, in milliseconds
+        with self._lock:
+            runs = list(self.runs)
+        samples = {"(whole rerun)": [r["seconds"] for r in runs]}
+        for r in runs:
+            for name, seconds in r["sections"].items():
+                samples.setdefault(name, []).append(seconds)
+        rows = [{"Section": name, "Reruns": len(values),
+                 "p50 (ms)": np.percentile(values, 50) * 1000, "p95 (ms)": np.percentile(values, 95) * 1000}
+                for name, values in samples.items() if values]
+        return pd.DataFrame(rows, columns=["Section", "Reruns", "p50 (ms)", "p95 (ms)"]).round(1)
+
+    def recent(self, n=20):
+        with self._lock:
+            runs = list(self.runs)[-n:]
+        return pd.DataFrame([{
+            "Started": pd.Timestamp(r["started"], unit="s").strftime("%H:%M:%S"), "Page": r["label"],
+            "Outcome": r["outcome"], "ms": round(r["seconds"] * 1000, 1),
+            "RSS (MB)": round(r["rss_mb"], 1), "RSS change (MB)": round(r["rss_delta_mb"], 1),
+        } for r in reversed(runs)])
+
+    # ---------- profiling ----------
+    def set_profiler(self, kind, keep):
+        if kind != self.profiler or keep != self.profiles.maxlen:
+            self.profiles = deque(maxlen=keep)
+        if kind != "tracemalloc" and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.profiler = kind
+
+    def dump(self):
+        # (file name, bytes, text summary) covering every kept rerun
+        profiles = [p for _, p in self.profiles]
+        if not profiles:
+            return None
+        if isinstance(profiles[0], cProfile.Profile):
+            stats = pstats.Stats(profiles[0])
+            for p in profiles[1:]:
+                stats.add(p)
+            text = io.StringIO()
+            stats.stream = text
+            stats.sort_stats("cumulative").print_stats(30)
+            return f"reruns_{len(profiles)}.prof", marshal.dumps(stats.stats), text.getvalue()
+        first, last = profiles[0], profiles[-1]
+        top = last.compare_to(first, "lineno") if len(profiles) > 1 else last.statistics("lineno")
+        text = "\n".join(str(stat) for stat in top[:30])
+        # same format as Snapshot.dump(); read back with tracemalloc.Snapshot.load
+        return "last_rerun.tracemalloc", pickle.dumps(last, pickle.HIGHEST_PROTOCOL), text
+
+
+recorder = Recorder(enabled=os.environ.get("GROW_TRACKER_INSTRUMENT", "") not in ("", "0"))
+section = recorder.section
+timed = recorder.timed
@@ -0,0 +1,32 @@
+import pandas as pd
+
+# ===================== RECORD KEYS =====================
+# How rows are matched across tables and the views built on them. Plant
+# IDs are trimmed; strain and breeder names are trimmed and
+# case-insensitive. Blank is no key (None / NA).
+
+
+def plant_key(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def plant_keys(series):
+    # vectorised plant_key, as a list
+    keys = series.astype("string").str.strip()
+    return [None if pd.isna(k) or k == "" else k for k in keys.tolist()]
+
+
+def strain_key(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    value = str(value).strip().casefold()
+    return value or None
+
+
+def strain_keys(series):
+    # vectorised strain_key, as a string Series with NA for blanks
+    keys = series.astype("string").str.strip().str.casefold()
+    return keys.where(keys != "")
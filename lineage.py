@@ -0,0 +1,254 @@
+from bisect import insort
+from collections import defaultdict
+
+import pandas as pd
+
+from keys import plant_key, plant_keys
+
+# ===================== MOTHER / CLONE LINEAGE =====================
+# Adjacency index over plants keyed by Plant ID: each plant's mother and
+# each mother's children. Every node also carries running totals for its
+# whole subtree (plant count, trimmed yield, rating sum / count), adjusted
+# along the ancestor chain on each write. So ancestry is O(depth), subtree
+# totals are O(1) and listing a subtree only walks that subtree.
+#
+# A Mother ID that is not (yet) a plant is still a node, just one with no
+# row of its own. Plants are linked in the order of their latest rows and a
+# link that would close a loop is refused and listed in `cycles`, so the
+# tree doesn't depend on how the index was built. A write that could change
+# which link of a loop is refused relinks everything that way instead.
+
+MAX_DEPTH = 10_000
+
+
+def _own(row):
+    # (plants, trimmed yield, rating sum, rated plants) for one row
+    grams = row.get("Trimmed Yield (g)")
+    rating = row.get("Rating (1-10)")
+    grams = 0.0 if grams is None or pd.isna(grams) else float(grams)
+    rated = rating is not None and not pd.isna(rating)
+    return (1, grams, float(rating) if rated else 0.0, 1 if rated else 0)
+
+
+def _add(a, b, sign=1):
+    return tuple(x + sign * y for x, y in zip(a, b))
+
+
+ZERO = (0, 0.0, 0.0, 0)
+
+
+class LineageIndex:
+    def __init__(self):
+        self.rows = {}                      # row id -> (Plant ID, Mother ID, own totals)
+        self.rows_by_plant = defaultdict(list)
+        self.parent = {}                    # Plant ID -> Mother ID
+        self.children = defaultdict(set)    # Mother ID -> Plant IDs
+        self.own = defaultdict(lambda: ZERO)
+        self.subtree = defaultdict(lambda: ZERO)  # descendants only, not the node itself
+        self.cycles = set()
+        self.last_row = 0                   # highest row id seen
+
+    # ---------- loading ----------
+    def load(self, name, df):
+        if name != "plants":
+            return
+        self.rows.clear()
+        self.rows_by_plant.clear()
+        self.last_row = 0
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name != "plants":
+            return
+        if len(df) == 0:
+            return
+        grams = pd.to_numeric(df["Trimmed Yield (g)"], errors="coerce").astype("float64")
+        rating = pd.to_numeric(df["Rating (1-10)"], errors="coerce").astype("float64")
+        owns = zip([1] * len(df), grams.fillna(0.0).tolist(), rating.fillna(0.0).tolist(),
+                   rating.notna().astype(int).tolist())
+        for row_id, plant, mother, own in zip(df.index, plant_keys(df["Plant ID"]), plant_keys(df["Mother ID"]), owns):
+            if plant is None:
+                continue
+            self.rows[row_id] = (plant, mother, own)
+            self.rows_by_plant[plant].append(row_id)
+        self.last_row = max(self.last_row, int(df.index.max()))
+        self._rebuild()
+
+    def _rebuild(self):
+        # Links from each plant's latest row, in row order, then subtree
+        # totals summed children-first
+        self.parent.clear()
+        self.children.clear()
+        self.own.clear()
+        self.subtree.clear()
+        self.cycles.clear()
+        own_totals = {}
+        for row_id in sorted(self.rows):
+            plant, _, own = self.rows[row_id]
+            have = own_totals.get(plant)
+            own_totals[plant] = own if have is None else _add(have, own)
+        self.own.update(own_totals)
+        latest = sorted((rows[-1], plant) for plant, rows in self.rows_by_plant.items() if rows)
+        for row_id, plant in latest:
+            mother = self.rows[row_id][1]
+            if mother is None:
+                continue
+            # a plant with no children yet can't close a loop
+            if mother == plant or (plant in self.children and plant in self.ancestry(mother)):
+                self.cycles.add(plant)
+                continue
+            self.parent[plant] = mother
+            self.children[mother].add(plant)
+
+        depth = {}
+        for plant in list(self.parent):
+            self._depth(plant, depth)
+        subtree = {}
+        for plant in sorted(self.parent, key=depth.get, reverse=True):
+            mother = self.parent[plant]
+            c, g, r, n = own_totals.get(plant, ZERO)
+            below = subtree.get(plant)
+            if below is not None:
+                c, g, r, n = c + below[0], g + below[1], r + below[2], n + below[3]
+            above = subtree.get(mother)
+            subtree[mother] = (c, g, r, n) if above is None else (above[0] + c, above[1] + g, above[2] + r, above[3] + n)
+        self.subtree.update(subtree)
+
+    def _depth(self, plant, depth):
+        chain, node = [], plant
+        while node in self.parent and node not in depth:
+            chain.append(node)
+            node = self.parent[node]
+        base = depth.get(node, 0)
+        for i, n in enumerate(reversed(chain), 1):
+            depth[n] = base + i
+
+    # ---------- incremental ----------
+    def _propagate(self, plant, totals, sign):
+        for ancestor in self.ancestry(plant):
+            self.subtree[ancestor] = _add(self.subtree[ancestor], totals, sign)
+
+    def _link(self, plant, mother):
+        old = self.parent.get(plant)
+        if old == mother:
+            return
+        moved = _add(self.own[plant], self.subtree[plant])
+        if old is not None:
+            self._propagate(plant, moved, -1)
+            self.children[old].discard(plant)
+            del self.parent[plant]
+        if mother is None:
+            return
+        self.parent[plant] = mother
+        self.children[mother].add(plant)
+        self._propagate(plant, moved, 1)
+
+    def on_insert(self, name, row_id, row):
+        if name != "plants":
+            return
+        plant = plant_key(row.get("Plant ID"))
+        if plant is None:
+            return
+        own = _own(row)
+        self.rows[row_id] = (plant, plant_key(row.get("Mother ID")), own)
+        insort(self.rows_by_plant[plant], row_id)
+        self.last_row = max(self.last_row, row_id)
+        self.own[plant] = _add(self.own[plant], own)
+        self._propagate(plant, own, 1)
+        self._relink(plant)
+
+    def on_delete(self, name, row_id, row):
+        if name != "plants" or row_id not in self.rows:
+            return
+        plant, _, own = self.rows.pop(row_id)
+        self.rows_by_plant[plant].remove(row_id)
+        self.own[plant] = _add(self.own[plant], own, -1)
+        self._propagate(plant, own, -1)
+        self._relink(plant)
+
+    def _relink(self, plant):
+        # Link `plant` from its latest row as _rebuild would. Patching is
+        # only safe while its link order can't decide a loop: otherwise
+        # relink everything.
+        rows = self.rows_by_plant.get(plant)
+        mother = self.rows[rows[-1]][1] if rows else None
+        if plant in self.parent and self._in_refused_loop(plant):
+            return self._rebuild()
+        self.cycles.discard(plant)
+        if mother is not None and (mother == plant or plant in self.ancestry(mother)):
+            if mother != plant and rows[-1] < self.last_row:
+                # not the last link made, so maybe not the one to refuse
+                return self._rebuild()
+            self._link(plant, None)
+            self.cycles.add(plant)
+            return
+        self._link(plant, mother)
+
+    def _in_refused_loop(self, plant):
+        # Does a refused link's loop run through `plant`'s own link?
+        for other in self.cycles:
+            rows = self.rows_by_plant.get(other)
+            mother = self.rows[rows[-1]][1] if rows else None
+            if other == plant or mother is None or mother == other:
+                continue
+            for node in [mother] + self.ancestry(mother):
+                if node == other:
+                    break
+                if node == plant:
+                    return True
+        return False
+
+    def on_update(self, name, row_id, old, new):
+        if name == "plants":
+            self.on_delete(name, row_id, old)
+            self.on_insert(name, row_id, new)
+
+    # ---------- queries ----------
+    def ancestry(self, plant):
+        # [mother, grandmother, ...]
+        chain, node = [], self.parent.get(plant)
+        while node is not None and len(chain) < MAX_DEPTH:
+            chain.append(node)
+            node = self.parent.get(node)
+        return chain
+
+    def descendants(self, plant):
+        # [(Plant ID, generation)] breadth-first
+        out, frontier, generation = [], [plant], 0
+        while frontier:
+            generation += 1
+            frontier = [child for node in frontier for child in sorted(self.children.get(node, ()))]
+            out.extend((child, generation) for child in frontier)
+        return out
+
+    def summary(self, plant):
+        plants, grams, rating_sum, rated = self.subtree[plant] if plant in self.subtree else ZERO
+        return {"Descendants": int(plants), "Direct children": len(self.children.get(plant, ())),
+                "Combined Trimmed Yield (g)": round(grams, 1),
+                "Average Rating": round(rating_sum / rated, 2) if rated else None}
+
+    def mothers(self):
+        # Plants with descendants, most descendants first
+        counts = {m: self.subtree[m][0] for m, kids in self.children.items() if kids}
+        return sorted(counts, key=lambda m: (-counts[m], m))
+
+    def row_ids(self, plants):
+        return [row_id for plant in plants for row_id in self.rows_by_plant.get(plant, ())]
+
+
+def lineage_index(store):
+    store.table("plants")
+    return store.lineage
+
+
+def lineage_frame(store, plant):
+    # Descendant rows of `plant` with their generation; touches only those rows
+    index = lineage_index(store)
+    with store.lock:
+        found = index.descendants(plant)
+        generation = dict(found)
+        rows = store.table("plants").frame.loc[index.row_ids(generation)]
+    columns = ["Plant ID", "Mother ID", "Type", "Strain Name", "Status", "Trimmed Yield (g)", "Rating (1-10)"]
+    out = rows[columns].copy()
+    out.insert(0, "Generation", out["Plant ID"].map(lambda p: generation.get(plant_key(p))).astype("Int32"))
+    return out
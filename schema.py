@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# ===================== COLUMN SCHEMA =====================
+# Declared dtypes for every table. Dates are datetime64, the select-box
+# enums are Categoricals, measurements are float32 and money stays float64.
+# Anything not listed keeps whatever pandas infers (text).
+
+VARIETIES = ["Sativa","Indica","Hybrid","Hybrid-Indica Dominant","Hybrid-Sativa Dominant","Autoflower"]
+GENDERS = ["Female","Male","Hermaphrodite"]
+ENVIRONMENTS = ["Indoor","Outdoor","Greenhouse"]
+PLANT_TYPES = ["Seed","Clone","Mother"]
+STATUSES = ["Germinating","Veg","Flower","Drying","Cured","Sold","Gifted","Lost"]
+KEEPER = ["Yes","No","Maybe"]
+EXPENSE_CATEGORIES = ["Seeds","Clones","Nutrients","Soil/Substrate","Pots/Fabric pots","Grow Lights","Tents/Fans",
+                      "Electricity","Water","Pest control","Labor","Salaries","Dividends","Donations","Marketing","Taxes","Misc"]
+PAYMENT_METHODS = ["Cash","EFT","Crypto","Other"]
+MOVEMENTS = ["Receipt","Consumption"]
+
+DATE = "datetime64[ns]"
+
+
+def _enum(values):
+    return CategoricalDtype(values)
+
+
+SCHEMA = {
+    "plants": {
+        'Variety': _enum(VARIETIES), 'Gender': _enum(GENDERS), 'Environment': _enum(ENVIRONMENTS),
+        'Type': _enum(PLANT_TYPES), 'Status': _enum(STATUSES),
+        'Date Germination': DATE, 'Date Transplant Veg': DATE, 'Date Flip Flower': DATE, 'Date Harvest': DATE,
+        'Wet Weight (g)': 'float32', 'Dry Weight (g)': 'float32', 'Trimmed Yield (g)': 'float32',
+        'Pot Size (L)': 'float32', 'Rating (1-10)': 'Int8',
+    },
+    "strains": {
+        'Variety': _enum(VARIETIES), 'Keeper?': _enum(KEEPER),
+        'THC %': 'float32', 'Average Yield (g/plant)': 'float32', 'Times Grown': 'Int32',
+    },
+    "expenses": {
+        'Date': DATE, 'Category': _enum(EXPENSE_CATEGORIES), 'Cost (ZAR)': 'float64', 'Quantity': 'Int32',
+    },
+    "income": {
+        'Date': DATE, 'Grams Sold': 'float32', 'Price per Gram': 'float64',
+        'Payment Method': _enum(PAYMENT_METHODS),
+    },
+    "stock": {
+        'Date': DATE, 'Movement': _enum(MOVEMENTS), 'Seeds': 'Int32', 'Cost (ZAR)': 'float64',
+    },
+    "feeding": {
+        'Date': DATE,
+    },
+    "feeding_doses": {
+        'Event ID': 'Int64', 'Date': DATE, 'Dose #': 'Int8', 'Amount (ml/L)': 'float32',
+    },
+}
+
+
+def coerce_column(series, dtype):
+    if series.dtype == dtype:
+        return series
+    if isinstance(dtype, CategoricalDtype):
+        # values outside the enum become missing
+        return series.astype(object).astype(dtype)
+    if dtype == DATE:
+        return pd.to_datetime(series, errors="coerce").dt.normalize().astype(DATE)
+    values = pd.to_numeric(series, errors="coerce")
+    if str(dtype).startswith("Int"):
+        # values the type can't hold become missing
+        limits = np.iinfo(str(dtype).lower())
+        values = values.round()
+        values = values.where((values >= limits.min) & (values <= limits.max))
+    return values.astype(dtype)
+
+
+def coerce_frame(name, df):
+    changes = {col: coerce_column(df[col], dtype) for col, dtype in SCHEMA[name].items() if col in df.columns}
+    return df.assign(**changes) if changes else df
+
+
+def coerce_row(name, row):
+    # Scalar version for single-row updates; goes through the same rules
+    return coerce_frame(name, pd.DataFrame([row])).iloc[0].to_dict()
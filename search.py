@@ -0,0 +1,280 @@
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import timed
+
+# ===================== NOTES SEARCH =====================
+# Inverted index over the free-text fields: token -> {(table, row id): term
+# count}. Built with one vectorised tokenise per field when a table is
+# first searched, then adjusted per insert / update / delete from the old
+# and new rows, so a query only touches the postings of its own terms.
+# Until then the table's writes are ignored: the build reads the whole
+# frame. A reloaded table is dropped and built again on the next search,
+# and its rows keep their doc numbers, so reloads don't grow the lists.
+#
+# Tokens are lower-case words and numbers, keeping decimals together so
+# "EC 1.8" is "ec" + "1.8". Every term must match (the last one as a
+# prefix, for half-typed words); hits are ranked with BM25.
+
+FIELDS = {
+    "plants": ["Phenotype Notes", "Health Issues"],
+    "strains": ["Best Pheno Notes"],
+    "expenses": ["Notes"],
+    "feeding": ["Notes"],
+}
+# what a hit is called: columns joined with " · "
+LABELS = {
+    "plants": ["Plant ID", "Strain Name"],
+    "strains": ["Strain Name"],
+    "expenses": ["Date", "Item"],
+    "feeding": ["Date", "Stage"],
+}
+TOKEN = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+K1, B = 1.2, 0.75
+MAX_PREFIX_TERMS = 50
+
+
+def tokenize(text):
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return []
+    return TOKEN.findall(str(text).lower())
+
+
+def _row_tokens(name, row):
+    return Counter(t for field in FIELDS[name] for t in tokenize(row.get(field)))
+
+
+class SearchIndex:
+    def __init__(self):
+        self.postings = defaultdict(dict)  # token -> {doc: count}
+        self.docs = []                     # doc -> (table, row id)
+        self.doc_ids = {}                  # (table, row id) -> doc
+        self.lengths = []                  # doc -> tokens in its fields, 0 once gone
+        self.live = 0
+        self.total_length = 0
+        self._arrays = {}                  # token -> (docs, counts) as sorted arrays
+        self._length_array = None
+        self._vocabulary = None            # sorted tokens, rebuilt after new tokens arrive
+        self.built = set()                 # tables indexed so far
+
+    def _changed(self, token):
+        self._arrays.pop(token, None)
+
+    def _set_length(self, doc, length):
+        old = self.lengths[doc]
+        self.lengths[doc] = length
+        self.live += (length > 0) - (old > 0)
+        self.total_length += length - old
+        self._length_array = None
+
+    def _doc(self, key):
+        doc = self.doc_ids.get(key)
+        if doc is None:
+            doc = self.doc_ids[key] = len(self.docs)
+            self.docs.append(key)
+            self.lengths.append(0)
+        return doc
+
+    def load(self, name, df):
+        # (Re)loaded table: forget it until it's next searched
+        if name not in FIELDS or name not in self.built:
+            return
+        self.built.discard(name)
+        gone = {doc for key, doc in self.doc_ids.items() if key[0] == name}
+        for doc in gone:
+            self._set_length(doc, 0)
+        for token in list(self.postings):
+            docs = self.postings[token]
+            if any(doc in gone for doc in docs):
+                for doc in gone.intersection(docs):
+                    del docs[doc]
+                self._changed(token)
+                if not docs:
+                    del self.postings[token]
+        self._vocabulary = None
+
+    def build(self, name, df):
+        if name in FIELDS and name not in self.built:
+            self.built.add(name)
+            self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name not in self.built or len(df) == 0:
+            return
+        rows, tokens = [], []
+        for field in FIELDS[name]:
+            # tokenise each distinct text once
+            codes, texts = pd.factorize(df[field].astype(object), use_na_sentinel=True)
+            if len(texts) == 0:
+                continue
+            per_text = [tokenize(t) for t in texts]
+            sizes = np.array([len(t) for t in per_text], dtype=np.int64)
+            present = codes >= 0
+            counts = np.where(present, sizes[np.where(present, codes, 0)], 0)
+            rows.append(np.repeat(df.index.to_numpy(), counts))
+            flat = [t for c in codes[present] for t in per_text[c]]
+            tokens.append(np.array(flat, dtype=object))
+        if not rows or sum(len(r) for r in rows) == 0:
+            return
+        rows, tokens = np.concatenate(rows), np.concatenate(tokens)
+        row_values, row_codes = np.unique(rows, return_inverse=True)
+        token_codes, token_values = pd.factorize(tokens)
+        pairs, counts = np.unique(row_codes.astype(np.int64) * len(token_values) + token_codes, return_counts=True)
+        pair_rows, pair_tokens = pairs // len(token_values), pairs % len(token_values)
+
+        row_docs = np.array([self._doc((name, r)) for r in row_values.tolist()], dtype=np.int64)
+        for doc, length in zip(row_docs.tolist(), np.bincount(pair_rows, weights=counts).astype(np.int64).tolist()):
+            self._set_length(doc, length)
+
+        # pairs come sorted by row; regroup by token
+        order = np.argsort(pair_tokens, kind="stable")
+        pair_tokens, docs, counts = pair_tokens[order], row_docs[pair_rows[order]].tolist(), counts[order].tolist()
+        bounds = np.flatnonzero(np.diff(pair_tokens)) + 1
+        for lo, hi in zip([0, *bounds.tolist()], [*bounds.tolist(), len(docs)]):
+            token = token_values[pair_tokens[lo]]
+            self.postings[token].update(zip(docs[lo:hi], counts[lo:hi]))
+            self._changed(token)
+        self._vocabulary = None
+
+    def _apply(self, name, row_id, row, sign):
+        key = (name, row_id)
+        counts = _row_tokens(name, row)
+        doc = self._doc(key) if sign > 0 else self.doc_ids.get(key)
+        if doc is None:
+            return
+        for token, count in counts.items():
+            if sign > 0:
+                if token not in self.postings:
+                    self._vocabulary = None
+                self.postings[token][doc] = count
+            else:
+                docs = self.postings.get(token, {})
+                docs.pop(doc, None)
+                if not docs:
+                    self.postings.pop(token, None)
+            self._changed(token)
+        self._set_length(doc, sum(counts.values()) if sign > 0 else 0)
+
+    def on_insert(self, name, row_id, row):
+        if name in self.built:
+            self._apply(name, row_id, row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        if name in self.built:
+            self._apply(name, row_id, old, -1)
+            self._apply(name, row_id, new, 1)
+
+    def on_delete(self, name, row_id, row):
+        if name in self.built:
+            self._apply(name, row_id, row, -1)
+
+    # ---------- queries ----------
+    def _expand(self, term):
+        # Tokens starting with `term`, most documents first
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff")
+        # the list can hold tokens deleted since it was built
+        found = [t for t in self._vocabulary[start:end] if t in self.postings]
+        return sorted(found, key=lambda t: -len(self.postings[t]))[:MAX_PREFIX_TERMS]
+
+    def _array(self, token):
+        arrays = self._arrays.get(token)
+        if arrays is None:
+            docs = self.postings[token]
+            ids = np.fromiter(docs.keys(), dtype=np.int64, count=len(docs))
+            counts = np.fromiter(docs.values(), dtype=np.float64, count=len(docs))
+            order = np.argsort(ids)
+            arrays = self._arrays[token] = (ids[order], counts[order])
+        return arrays
+
+    def _group_scores(self, group, lengths, n, average):
+        # BM25 of one query term (a token, or every token a prefix expands to)
+        ids, scores = [], []
+        for token in group:
+            docs, counts = self._array(token)
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = K1 * (1 - B + B * lengths[docs] / average)
+            ids.append(docs)
+            scores.append(idf * counts * (K1 + 1) / (counts + norm))
+        if len(ids) == 1:
+            return ids[0], scores[0]
+        ids, inverse = np.unique(np.concatenate(ids), return_inverse=True)
+        return ids, np.bincount(inverse, weights=np.concatenate(scores))
+
+    def search(self, query, limit=20):
+        # [(score, (table, row id), matched tokens)] best first
+        terms = tokenize(query)
+        if not terms or not self.live:
+            return []
+        groups = [[t] if t in self.postings else [] for t in terms[:-1]] + [self._expand(terms[-1])]
+        if not all(groups):
+            return []
+        if self._length_array is None:
+            self._length_array = np.array(self.lengths, dtype=np.float64)
+        lengths, n = self._length_array, self.live
+        average = self.total_length / n
+        ids = scores = None
+        for group in groups:
+            group_ids, group_scores = self._group_scores(group, lengths, n, average)
+            if ids is None:
+                ids, scores = group_ids, group_scores
+            else:
+                ids, left, right = np.intersect1d(ids, group_ids, assume_unique=True, return_indices=True)
+                scores = scores[left] + group_scores[right]
+            if len(ids) == 0:
+                return []
+        top = np.argpartition(-scores, limit - 1)[:limit] if len(ids) > limit else np.arange(len(ids))
+        top = top[np.lexsort((ids[top], -scores[top]))]
+        hits = []
+        for doc, score in zip(ids[top].tolist(), scores[top].tolist()):
+            matched = {t for group in groups for t in group if doc in self.postings[t]}
+            hits.append((score, self.docs[doc], matched))
+        return hits
+
+
+def _snippet(text, tokens, width=60):
+    text = " ".join(str(text).split())
+    lower = text.lower()
+    at = min((i for i in (lower.find(t) for t in tokens) if i >= 0), default=0)
+    start = max(0, at - width // 3)
+    out = text[start:start + width]
+    return ("…" if start else "") + out + ("…" if start + width < len(text) else "")
+
+
+def _label(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return "-"
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat()
+    return str(value)
+
+
+def search_index(store):
+    # Builds the tables not indexed yet; the first search pays for it
+    with store.lock:
+        for name in FIELDS:
+            store.search_index.build(name, store.table(name).frame)
+    return store.search_index
+
+
+@timed()
+def search(store, query, limit=20):
+    # Ranked hits as a frame: Table, Row, Record, Field, Snippet, Score
+    index = search_index(store)
+    rows = []
+    with store.lock:
+        for score, (name, row_id), tokens in index.search(query, limit):
+            row = store.table(name).get(row_id)
+            field = next((f for f in FIELDS[name] if set(tokenize(row.get(f))) & tokens), FIELDS[name][0])
+            label = " · ".join(_label(row.get(c)) for c in LABELS[name])
+            rows.append({"Table": name, "Row": row_id, "Record": label, "Field": field,
+                         "Snippet": _snippet(row.get(field), tokens), "Score": round(score, 2)})
+    return pd.DataFrame(rows, columns=["Table", "Row", "Record", "Field", "Snippet", "Score"])
+
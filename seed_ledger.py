@@ -0,0 +1,208 @@
+from collections import defaultdict
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from keys import plant_key, plant_keys, strain_key, strain_keys
+
+# ===================== SEED LEDGER =====================
+# The stock table is append-only: a Receipt adds seeds at a pack cost, a
+# Consumption takes seeds out at the lot's average cost per seed at that
+# moment and names the plant they went to. Seeds and cost are always
+# positive; Movement gives the direction.
+#
+# Running totals per (strain, breeder) lot, per plant and per strain are
+# kept on every write, so balances and seed cost per gram are lookups.
+# Strains, breeders and Plant IDs are matched with the shared keys, as in
+# strain_stats and the lineage index.
+
+
+class SeedLedger:
+    def __init__(self):
+        self.balances = {}                    # (strain, breeder) -> (seeds, value, seeds received, cost received)
+        self.names = {}                       # same key -> (Strain, Breeder) as first entered
+        self.lots = defaultdict(set)          # strain -> {(strain, breeder)}
+        self.plant_cost = defaultdict(float)  # Plant ID -> seed cost
+        self.strain_cost = defaultdict(float) # strain -> seed cost of its plants
+
+    def load(self, name, df):
+        if name != "stock":
+            return
+        for state in (self.balances, self.names, self.lots, self.plant_cost, self.strain_cost):
+            state.clear()
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name != "stock" or len(df) == 0:
+            return
+        seeds = pd.to_numeric(df["Seeds"], errors="coerce").astype("float64").fillna(0.0).to_numpy()
+        cost = pd.to_numeric(df["Cost (ZAR)"], errors="coerce").astype("float64").fillna(0.0).to_numpy()
+        out = (df["Movement"].astype(object) == "Consumption").to_numpy()
+        plants = df["Plant ID"].astype("string").str.strip()
+        moves = pd.DataFrame({
+            "strain": strain_keys(df["Strain"]).to_numpy(), "breeder": strain_keys(df["Breeder"]).fillna("").to_numpy(),
+            "seeds": np.where(out, -seeds, seeds), "value": np.where(out, -cost, cost),
+            "received": np.where(out, 0.0, seeds), "paid": np.where(out, 0.0, cost), "cost": cost, "out": out,
+            "plant": plants.where(plants != "").to_numpy(), "Strain": df["Strain"].to_numpy(), "Breeder": df["Breeder"].to_numpy(),
+        })
+        moves = moves[moves["strain"].notna()]
+        lots = moves.groupby(["strain", "breeder"], sort=False).agg(
+            seeds=("seeds", "sum"), value=("value", "sum"), received=("received", "sum"), paid=("paid", "sum"),
+            Strain=("Strain", "first"), Breeder=("Breeder", "first"))
+        for key, seeds, value, received, paid, strain, breeder in lots.itertuples(name=None):
+            self._add_lot(key, (seeds, value, received, paid), 1, (strain, breeder))
+        consumed = moves[moves["out"]]
+        for plant, total in consumed[consumed["plant"].notna()].groupby("plant")["cost"].sum().items():
+            self.plant_cost[plant] += total
+        for strain, total in consumed.groupby("strain")["cost"].sum().items():
+            self.strain_cost[strain] += total
+
+    def _add_lot(self, key, totals, sign, names):
+        self.balances[key] = tuple(a + sign * b for a, b in zip(self.balances.get(key, (0, 0.0, 0, 0.0)), totals))
+        self.names.setdefault(key, tuple("" if pd.isna(n) else str(n).strip() for n in names))
+        self.lots[key[0]].add(key)
+
+    def _apply(self, row, sign):
+        strain = strain_key(row.get("Strain"))
+        if strain is None:
+            return
+        key = (strain, strain_key(row.get("Breeder")) or "")
+        seeds, cost = row.get("Seeds"), row.get("Cost (ZAR)")
+        seeds = 0.0 if seeds is None or pd.isna(seeds) else float(seeds)
+        cost = 0.0 if cost is None or pd.isna(cost) else float(cost)
+        if row.get("Movement") == "Consumption":
+            self._add_lot(key, (-seeds, -cost, 0.0, 0.0), sign, (row.get("Strain"), row.get("Breeder")))
+            plant = plant_key(row.get("Plant ID"))
+            if plant is not None:
+                self.plant_cost[plant] += sign * cost
+            self.strain_cost[strain] += sign * cost
+        else:
+            self._add_lot(key, (seeds, cost, seeds, cost), sign, (row.get("Strain"), row.get("Breeder")))
+
+    def on_insert(self, name, row_id, row):
+        if name == "stock":
+            self._apply(row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        if name == "stock":
+            self._apply(old, -1)
+            self._apply(new, 1)
+
+    def on_delete(self, name, row_id, row):
+        if name == "stock":
+            self._apply(row, -1)
+
+    # ---------- queries ----------
+    def unit_cost(self, key):
+        # Average cost of a seed still in the lot; what was paid if it's empty
+        seeds, value, received, paid = self.balances.get(key, (0, 0.0, 0, 0.0))
+        if seeds > 0:
+            return max(value, 0.0) / seeds
+        return paid / received if received else 0.0
+
+    def pick(self, strain, breeder=None, taken=None):
+        # Lot a new seed plant draws from: the named breeder's if it has
+        # seeds, else the fullest lot of the strain; None if none have seeds.
+        # `taken`: seeds per lot already booked out by a batch in progress.
+        left = {k: self.balances[k][0] - (taken or {}).get(k, 0) for k in self.lots.get(strain_key(strain), ())}
+        lots = [k for k, seeds in left.items() if seeds > 0]
+        wanted = [k for k in lots if k[1] == (strain_key(breeder) or "")]
+        if wanted:
+            return wanted[0]
+        return max(lots, key=lambda k: (left[k], k[1]), default=None)
+
+    def seeds_on_hand(self):
+        return int(sum(max(b[0], 0) for b in self.balances.values()))
+
+    def balance_frame(self):
+        rows = []
+        for key, (seeds, value, received, paid) in self.balances.items():
+            strain, breeder = self.names[key]
+            rows.append({"Strain": strain, "Breeder": breeder, "Seeds Left": int(seeds),
+                         "Stock Value (ZAR)": round(value, 2), "Cost/Seed (ZAR)": round(self.unit_cost(key), 2),
+                         "Seeds Received": int(received), "Paid (ZAR)": round(paid, 2)})
+        columns = ["Strain", "Breeder", "Seeds Left", "Stock Value (ZAR)", "Cost/Seed (ZAR)",
+                   "Seeds Received", "Paid (ZAR)"]
+        return pd.DataFrame(rows, columns=columns).sort_values(["Strain", "Breeder"], kind="stable")
+
+
+def seed_ledger(store):
+    store.table("stock")
+    return store.seeds
+
+
+def consume_seed(store, plant):
+    # Books one seed out for a new Seed-type plant. Returns (cost, booked):
+    # a plant re-added under the same ID keeps the seed it already has
+    # (cost of that seed, False); (None, False) when there's no stock.
+    ledger = seed_ledger(store)
+    with store.lock:
+        plant_id = plant_key(plant.get("Plant ID"))
+        if plant_id in ledger.plant_cost:
+            return round(ledger.plant_cost[plant_id], 2), False
+        key = ledger.pick(plant.get("Strain Name"), plant.get("Source"))
+        if key is None:
+            return None, False
+        cost = round(ledger.unit_cost(key), 2)
+        strain, breeder = ledger.names[key]
+        store.insert("stock", {
+            "Date": plant.get("Date Germination") or date.today(), "Strain": strain, "Breeder": breeder,
+            "Movement": "Consumption", "Seeds": 1, "Cost (ZAR)": cost, "Plant ID": plant.get("Plant ID"),
+            "Notes": "Seed plant added",
+        })
+        return cost, True
+
+
+def consume_seeds(store, plants):
+    # consume_seed for a frame of imported plants: one seed per Seed-type
+    # plant that hasn't had one booked yet, written as one batch. Returns
+    # (booked, plants with no stock of their strain).
+    ledger = seed_ledger(store)
+    seed_plants = plants[(plants["Type"].astype(object) == "Seed").to_numpy()]
+    rows, missing, taken, seen = [], 0, defaultdict(int), set()
+    with store.lock:
+        for plant, strain, source, germinated in zip(
+                plant_keys(seed_plants["Plant ID"]), seed_plants["Strain Name"].tolist(),
+                seed_plants["Source"].tolist(), seed_plants["Date Germination"].tolist()):
+            if plant is None or plant in seen or plant in ledger.plant_cost:
+                continue
+            seen.add(plant)
+            key = ledger.pick(strain, source, taken)
+            if key is None:
+                missing += 1
+                continue
+            taken[key] += 1
+            name, breeder = ledger.names[key]
+            rows.append({
+                "Date": germinated if pd.notna(germinated) else date.today(), "Strain": name, "Breeder": breeder,
+                "Movement": "Consumption", "Seeds": 1, "Cost (ZAR)": round(ledger.unit_cost(key), 2),
+                "Plant ID": plant, "Notes": "Seed plant imported",
+            })
+        if rows:
+            store.insert_frame("stock", pd.DataFrame(rows))
+    return len(rows), missing
+
+
+def plant_seed_costs(store, plants):
+    # Seed cost and seed cost per trimmed gram for a frame of plants
+    ledger = seed_ledger(store)
+    with store.lock:
+        cost = pd.Series([ledger.plant_cost.get(p, 0.0) for p in plant_keys(plants["Plant ID"])],
+                         index=plants.index, dtype="float64")
+    grams = pd.to_numeric(plants["Trimmed Yield (g)"], errors="coerce").astype("float64")
+    return pd.DataFrame({"Seed Cost (ZAR)": cost.round(2),
+                         "Seed Cost/g (ZAR)": (cost / grams.where(grams > 0)).round(2)}, index=plants.index)
+
+
+def strain_seed_costs(store):
+    # Seed cost per trimmed gram for every strain that has used seeds
+    ledger = seed_ledger(store)
+    store.table("plants")
+    with store.lock:
+        names = {key[0]: ledger.names[key][0] for key in ledger.names}
+        rows = [(names.get(strain, strain), cost, store.strain_stats.sums.get(strain, (0, 0, 0.0))[2])
+                for strain, cost in ledger.strain_cost.items() if abs(cost) > 1e-9]
+    df = pd.DataFrame(rows, columns=["Strain", "Seed Cost (ZAR)", "Trimmed Yield (g)"])
+    df["Seed Cost/g (ZAR)"] = (df["Seed Cost (ZAR)"] / df["Trimmed Yield (g)"].where(df["Trimmed Yield (g)"] > 0)).round(2)
+    return df.round({"Seed Cost (ZAR)": 2, "Trimmed Yield (g)": 1}).sort_values("Strain", kind="stable")
@@ -0,0 +1,50 @@
+import pandas as pd
+from datetime import date
+
+from instrumentation import timed
+
+# ===================== STAGE ENGINE =====================
+# Column-wise versions of the stage / day calculations. Every date column is
+# parsed once for the whole table and the labels are derived with masks, so
+# the cost is a handful of array ops instead of a Python call per plant.
+
+STAGE_DATE_COLUMNS = ["Date Germination", "Date Transplant Veg", "Date Flip Flower", "Date Harvest"]
+
+
+def parse_dates(col):
+    return pd.to_datetime(pd.Series(col), errors="coerce").dt.normalize()
+
+
+def today_ts(today=None):
+    return pd.Timestamp(today if today is not None else date.today()).normalize()
+
+
+@timed()
+def get_current_stage(plants, today=None):
+    today = today_ts(today)
+    germ, veg, flip, harvest = (parse_dates(plants[c]) for c in STAGE_DATE_COLUMNS)
+
+    stages = pd.Series("Not Started", index=plants.index, dtype=object)
+    # lowest priority first so Flower overrides Veg overrides Germ
+    for name, start in (("Germ", germ), ("Veg", veg), ("Flower", flip)):
+        days = (today - start).dt.days
+        started = (days >= 0).to_numpy()
+        weeks = (days[started] // 7 + 1).astype(int).astype(str)
+        stages[started] = f"{name} Week " + weeks
+    stages[(harvest <= today).to_numpy()] = "Harvested"
+    return stages
+
+
+# ===================== CALCULATIONS =====================
+def _days_between(start, end):
+    return (parse_dates(end) - parse_dates(start)).dt.days.astype("Int64")
+
+
+@timed()
+def calculate_flowering_days(flip, harvest):
+    return _days_between(flip, harvest)
+
+
+@timed()
+def calculate_total_days(germ, harvest):
+    return _days_between(germ, harvest)
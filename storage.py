@@ -0,0 +1,285 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from schema import coerce_frame
+
+# ===================== TABLE DEFINITIONS =====================
+TABLES = {
+    "plants": [
+        'Plant ID', 'Strain Name', 'Variety', 'Gender', 'Environment', 'Type', 'Source', 'Batch #',
+        'Date Germination', 'Date Transplant Veg', 'Date Flip Flower', 'Date Harvest',
+        'Wet Weight (g)', 'Dry Weight (g)', 'Trimmed Yield (g)', 'Mother ID',
+        'Pot Size (L)', 'Medium', 'Phenotype Notes', 'Health Issues',
+        'Rating (1-10)', 'Photos Link', 'Status', 'Created By'
+    ],
+    "strains": [
+        'Strain Name', 'Breeder', 'Variety', 'Expected Flower Time', 'THC %',
+        'Terpene Profile', 'Average Yield (g/plant)', 'Times Grown', 'Best Pheno Notes', 'Keeper?', 'Created By'
+    ],
+    "expenses": [
+        'Date', 'Category', 'Item', 'Supplier', 'Cost (ZAR)', 'Quantity', 'Paid To', 'Notes', 'Receipt Link', 'Created By'
+    ],
+    "income": [
+        'Date', 'Strain', 'Grams Sold', 'Price per Gram', 'Buyer/Channel', 'Payment Method', 'Notes', 'Created By'
+    ],
+    # seed ledger: one row per receipt or consumption, never edited
+    "stock": [
+        'Date', 'Strain', 'Breeder', 'Movement', 'Seeds', 'Cost (ZAR)', 'Plant ID', 'Notes', 'Created By'
+    ],
+    # one row per "Record Feeding" submit ...
+    "feeding": [
+        "Date", "Stage", "Notes", "Created By"
+    ],
+    # ... and one row per plant x nutrient dose in it
+    "feeding_doses": [
+        "Event ID", "Date", "Plant ID", "Plant Stage", "Dose #", "Nutrient", "Amount (ml/L)", "Created By"
+    ],
+}
+
+# Pre-normalisation layout of the feeding table, still used for the History
+# tab and the Excel sheet
+WIDE_FEEDING_COLUMNS = [
+    "Date", "Plant ID(s)", "Stage", "Nutrient 1", "Amount 1 (ml/L)",
+    "Nutrient 2", "Amount 2 (ml/L)", "Nutrient 3", "Amount 3 (ml/L)",
+    "Nutrient 4", "Amount 4 (ml/L)", "Nutrient 5", "Amount 5 (ml/L)", "Notes", "Created By"
+]
+
+# SQLite column affinities; everything not listed is TEXT
+COLUMN_TYPES = {
+    'Wet Weight (g)': 'REAL', 'Dry Weight (g)': 'REAL', 'Trimmed Yield (g)': 'REAL',
+    'Pot Size (L)': 'REAL', 'Rating (1-10)': 'INTEGER',
+    'THC %': 'REAL', 'Average Yield (g/plant)': 'REAL', 'Times Grown': 'INTEGER',
+    'Cost (ZAR)': 'REAL', 'Quantity': 'INTEGER',
+    'Grams Sold': 'REAL', 'Price per Gram': 'REAL',
+    'Seeds': 'INTEGER',
+    'Event ID': 'INTEGER', 'Dose #': 'INTEGER', 'Amount (ml/L)': 'REAL',
+}
+
+INDEXES = {
+    "plants": [['Plant ID'], ['Strain Name'], ['Status']],
+    "strains": [['Strain Name']],
+    "expenses": [['Date'], ['Category']],
+    "income": [['Date'], ['Strain']],
+    "stock": [['Strain', 'Breeder'], ['Plant ID']],
+    "feeding": [['Date']],
+    "feeding_doses": [['Plant ID', 'Date'], ['Event ID'], ['Date', 'Nutrient']],
+}
+
+DB_PATH = os.environ.get(
+    "GROW_TRACKER_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "grow_tracker.db")
+)
+
+
+def _q(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _to_sql(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class StaleTable(Exception):
+    # Another connection wrote the table after the version we were given
+    def __init__(self, table, expected, actual):
+        super().__init__(f"{table} is at version {actual}, expected {expected}")
+        self.table = table
+        self.expected = expected
+        self.actual = actual
+
+
+# ===================== SQLITE STORAGE =====================
+# Every write bumps the table's row in table_versions inside the same
+# transaction. Passing `expected` makes the write optimistic: it raises
+# StaleTable instead of writing over a version the caller has not seen.
+class Storage:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self.lock:
+            self.conn.execute("BEGIN")
+            try:
+                self._create_tables()
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _create_tables(self):
+        legacy = [r[1] for r in self.conn.execute("PRAGMA table_info(feeding)")]
+        if "Plant ID(s)" in legacy:
+            self.conn.execute("ALTER TABLE feeding RENAME TO feeding_wide_legacy")
+            # indexes keep their names across a rename; free them for the new table
+            self.conn.execute("DROP INDEX IF EXISTS idx_feeding_date")
+        legacy_stock = [r[1] for r in self.conn.execute("PRAGMA table_info(stock)")]
+        if "Seeds Left" in legacy_stock:
+            self.conn.execute("ALTER TABLE stock RENAME TO stock_list_legacy")
+            self.conn.execute("DROP INDEX IF EXISTS idx_stock_strain_breeder")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS table_versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+        self.conn.executemany("INSERT OR IGNORE INTO table_versions (name, version) VALUES (?, 0)",
+                              [(table,) for table in TABLES])
+        for table, columns in TABLES.items():
+            cols = ", ".join(f"{_q(c)} {COLUMN_TYPES.get(c, 'TEXT')}" for c in columns)
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY, {cols})")
+            # columns added since the database was created
+            existing = {r[1] for r in self.conn.execute(f"PRAGMA table_info({table})")}
+            for c in columns:
+                if c not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_q(c)} {COLUMN_TYPES.get(c, 'TEXT')}")
+            for idx_cols in INDEXES.get(table, []):
+                idx_name = f"idx_{table}_" + "_".join("".join(ch for ch in c.lower() if ch.isalnum()) for c in idx_cols)
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table} ({', '.join(_q(c) for c in idx_cols)})"
+                )
+        if "Plant ID(s)" in legacy:
+            self._migrate_wide_feeding()
+        if "Seeds Left" in legacy_stock:
+            self._migrate_stock_list()
+
+    def _migrate_wide_feeding(self):
+        # Explode the old one-row-per-feeding layout into events + doses
+        old = pd.read_sql_query("SELECT * FROM feeding_wide_legacy ORDER BY id", self.conn)
+        for _, row in old.iterrows():
+            event_id = self.insert("feeding", {"Date": row["Date"], "Stage": row["Stage"], "Notes": row["Notes"]})
+            plants = [p.strip() for p in str(row["Plant ID(s)"] or "").split(",") if p.strip()]
+            doses = [
+                {"Event ID": event_id, "Date": row["Date"], "Plant ID": plant, "Dose #": i,
+                 "Nutrient": row[f"Nutrient {i}"], "Amount (ml/L)": row[f"Amount {i} (ml/L)"]}
+                for plant in plants for i in range(1, 6) if pd.notna(row[f"Nutrient {i}"]) and row[f"Nutrient {i}"]
+            ]
+            self.insert_many("feeding_doses", doses)
+
+    def _migrate_stock_list(self):
+        # Each row of the old Seeds Left / Pack Cost list opens the ledger as a receipt
+        old = pd.read_sql_query("SELECT * FROM stock_list_legacy ORDER BY id", self.conn)
+        self.insert_many("stock", [
+            {"Strain": row["Strain"], "Breeder": row["Breeder"], "Movement": "Receipt",
+             "Seeds": row["Seeds Left"], "Cost (ZAR)": row["Pack Cost (ZAR)"],
+             "Notes": "Opening balance from the old stock list", "Created By": row.get("Created By")}
+            for _, row in old.iterrows()
+        ])
+
+    def _version(self, table):
+        return self.conn.execute("SELECT version FROM table_versions WHERE name = ?", (table,)).fetchone()[0]
+
+    def versions(self):
+        with self.lock:
+            return dict(self.conn.execute("SELECT name, version FROM table_versions"))
+
+    @contextmanager
+    def batch(self):
+        # Writes made inside share one transaction: all of them land or none
+        with self.lock:
+            if self.conn.in_transaction:
+                yield
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    @contextmanager
+    def _write(self, table, expected=None):
+        with self.batch():
+            if expected is not None:
+                actual = self._version(table)
+                if actual != expected:
+                    raise StaleTable(table, expected, actual)
+            yield
+            self.conn.execute("UPDATE table_versions SET version = version + 1 WHERE name = ?", (table,))
+
+    def _insert(self, table, row):
+        columns = [c for c in TABLES[table] if c in row]
+        sql = (f"INSERT INTO {table} ({', '.join(_q(c) for c in columns)}) "
+               f"VALUES ({', '.join('?' for _ in columns)})")
+        return self.conn.execute(sql, [_to_sql(row[c]) for c in columns]).lastrowid
+
+    def insert(self, table, row, expected=None):
+        with self._write(table, expected):
+            return self._insert(table, row)
+
+    def insert_many(self, table, rows, expected=None):
+        # One transaction for the batch; returns the new row ids in order
+        with self._write(table, expected):
+            return [self._insert(table, row) for row in rows]
+
+    def insert_frame(self, table, df, expected=None):
+        # executemany inside one write transaction; rowids are handed out
+        # consecutively while we hold the write lock
+        columns = [c for c in TABLES[table] if c in df.columns]
+        if len(df) == 0:
+            return []
+        values = df[columns].astype(object)
+        values = values.where(values.notna(), None)
+        sql = (f"INSERT INTO {table} ({', '.join(_q(c) for c in columns)}) "
+               f"VALUES ({', '.join('?' for _ in columns)})")
+        with self._write(table, expected):
+            self.conn.executemany(sql, ([_to_sql(v) for v in row] for row in values.itertuples(index=False)))
+            last = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(df) + 1, last + 1))
+
+    def read(self, table, columns=None, order_by=None, descending=False, limit=None):
+        columns = columns or TABLES[table]
+        sql = f"SELECT id, {', '.join(_q(c) for c in columns)} FROM {table}"
+        if order_by:
+            sql += f" ORDER BY {_q(order_by)} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self.lock:
+            df = pd.read_sql_query(sql, self.conn, index_col="id")
+        return coerce_frame(table, df)
+
+    def load(self, table):
+        # The whole table plus the version it is at, read in one transaction
+        with self.lock:
+            own = not self.conn.in_transaction
+            if own:
+                self.conn.execute("BEGIN")
+            try:
+                version = self._version(table)
+                df = self.read(table)
+            finally:
+                if own:
+                    self.conn.execute("COMMIT")
+        return df, version
+
+    def count(self, table):
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def total(self, table, column, weight=None):
+        expr = _q(column) if weight is None else f"{_q(column)} * {_q(weight)}"
+        with self.lock:
+            return self.conn.execute(f"SELECT COALESCE(SUM({expr}), 0) FROM {table}").fetchone()[0]
+
+    def update(self, table, row_id, changes, expected=None):
+        columns = [c for c in TABLES[table] if c in changes]
+        sql = f"UPDATE {table} SET {', '.join(f'{_q(c)} = ?' for c in columns)} WHERE id = ?"
+        with self._write(table, expected):
+            self.conn.execute(sql, [_to_sql(changes[c]) for c in columns] + [int(row_id)])
+
+    def delete(self, table, row_id, expected=None):
+        with self._write(table, expected):
+            self.conn.execute(f"DELETE FROM {table} WHERE id = ?", (int(row_id),))
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from keys import strain_key, strain_keys
+from stages import calculate_flowering_days
+
+# ===================== STRAIN STATISTICS =====================
+# Per-strain sums over the plants table keyed by Strain Name: plants grown,
+# harvested plants and their trimmed grams, flowering days and ratings.
+# Loaded with one groupby, then adjusted per plant insert / update / delete,
+# so the Strains Library and its Excel sheet only join a few hundred rows.
+#
+# Average yield counts plants with a trimmed yield above 0; flowering days
+# count plants with both Date Flip Flower and Date Harvest set.
+
+STAT_COLUMNS = ["Average Yield (g/plant)", "Times Grown", "Average Flowering Days", "Average Rating"]
+
+# grown, harvested, grams, flowered, flowering days, rated, rating sum
+ZERO = (0, 0, 0.0, 0, 0, 0, 0.0)
+
+
+def _contributions(df):
+    # one ZERO-shaped row of numbers per plant
+    grams = pd.to_numeric(df["Trimmed Yield (g)"], errors="coerce").astype("float64").fillna(0.0)
+    days = calculate_flowering_days(df["Date Flip Flower"], df["Date Harvest"])
+    flowered = (days.notna() & (days >= 0)).fillna(False).to_numpy(dtype=bool)
+    rating = pd.to_numeric(df["Rating (1-10)"], errors="coerce").astype("float64")
+    return pd.DataFrame({
+        "grown": 1,
+        "harvested": (grams > 0).astype(int).to_numpy(),
+        "grams": grams.where(grams > 0, 0.0).to_numpy(),
+        "flowered": flowered.astype(int),
+        "days": np.where(flowered, days.fillna(0).to_numpy(dtype="int64", na_value=0), 0),
+        "rated": rating.notna().astype(int).to_numpy(),
+        "rating": rating.fillna(0.0).to_numpy(),
+    }, index=df.index)
+
+
+class StrainStats:
+    def __init__(self):
+        self.sums = {}
+
+    def load(self, name, df):
+        if name != "plants":
+            return
+        self.sums.clear()
+        self.on_insert_frame(name, df)
+
+    def on_insert_frame(self, name, df):
+        if name != "plants" or len(df) == 0:
+            return
+        grouped = _contributions(df).groupby(strain_keys(df["Strain Name"]).to_numpy(), dropna=True).sum()
+        for key, values in zip(grouped.index, grouped.itertuples(index=False, name=None)):
+            self._add(key, values, 1)
+
+    def _add(self, key, values, sign):
+        totals = tuple(a + sign * b for a, b in zip(self.sums.get(key, ZERO), values))
+        if totals[0] > 0:
+            self.sums[key] = totals
+        else:
+            self.sums.pop(key, None)
+
+    def _apply(self, row, sign):
+        key = strain_key(row.get("Strain Name"))
+        if key is None:
+            return
+        frame = pd.DataFrame([{c: row.get(c) for c in
+                               ("Trimmed Yield (g)", "Date Flip Flower", "Date Harvest", "Rating (1-10)")}])
+        self._add(key, next(_contributions(frame).itertuples(index=False, name=None)), sign)
+
+    def on_insert(self, name, row_id, row):
+        if name == "plants":
+            self._apply(row, 1)
+
+    def on_update(self, name, row_id, old, new):
+        if name == "plants":
+            self._apply(old, -1)
+            self._apply(new, 1)
+
+    def on_delete(self, name, row_id, row):
+        if name == "plants":
+            self._apply(row, -1)
+
+    def stats(self, strain):
+        grown, harvested, grams, flowered, days, rated, rating = self.sums.get(strain_key(strain), ZERO)
+        return {
+            "Average Yield (g/plant)": round(grams / harvested, 1) if harvested else None,
+            "Times Grown": int(grown),
+            "Average Flowering Days": round(days / flowered, 1) if flowered else None,
+            "Average Rating": round(rating / rated, 1) if rated else None,
+        }
+
+    def frame(self, strains):
+        # Stat columns for a Strain Name series, aligned to its index
+        rows = [self.stats(strain) for strain in strains]
+        return pd.DataFrame(rows, index=strains.index, columns=STAT_COLUMNS).astype({
+            "Average Yield (g/plant)": "float64", "Times Grown": "Int32",
+            "Average Flowering Days": "float64", "Average Rating": "float64",
+        })
+
+
+def strain_library(store):
+    # The strains table with its stat columns filled from the plants
+    store.table("plants")
+    strains = store.read("strains")
+    with store.lock:
+        stats = store.strain_stats.frame(strains["Strain Name"])
+    columns = [c for c in strains.columns if c not in stats.columns]
+    at = columns.index("Best Pheno Notes") if "Best Pheno Notes" in columns else len(columns)
+    out = strains[columns].join(stats)
+    return out[columns[:at] + STAT_COLUMNS + columns[at:]]
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from instrumentation import timed
+
+# ===================== TABLE VIEW =====================
+# Filter, sort and paginate on the server; only the visible page is sent to
+# the browser. Columns that are only for display (day counts, totals...) can
+# be added through `derive`, which runs on the visible page alone.
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def show_table(df):
+    dates = {c: st.column_config.DateColumn(c) for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])}
+    st.dataframe(df, use_container_width=True, hide_index=True, column_config=dates)
+
+
+def _options(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return list(series.cat.categories)
+    # raw values, so what's picked compares equal to the column
+    values = series.dropna().unique().tolist()
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+
+def filter_mask(df, key, filters, date_column):
+    mask = np.ones(len(df), dtype=bool)
+    cols = st.columns(max(1, len(filters) + (date_column is not None)))
+    for i, col in enumerate(filters):
+        chosen = cols[i].multiselect(col, _options(df[col]), format_func=str, key=f"{key}_filter_{col}")
+        if chosen:
+            mask &= df[col].astype(object).isin(chosen).to_numpy()
+    if date_column is not None:
+        dates = df[date_column]
+        lo, hi = dates.min(), dates.max()
+        if pd.notna(lo):
+            default = (lo.date(), hi.date())
+            picked = cols[-1].date_input(date_column, value=default, key=f"{key}_dates")
+            # the full range is no filter: rows without a date stay in
+            if len(picked) == 2 and tuple(picked) != default:
+                start, end = pd.Timestamp(picked[0]), pd.Timestamp(picked[1])
+                mask &= ((dates >= start) & (dates <= end)).to_numpy()
+    return mask
+
+
+def sort_view(df, column, descending):
+    if column is None:
+        return df
+    values = df[column]
+    # already in order (e.g. ledgers entered by date): just slice, no sort
+    if values.is_monotonic_increasing and not values.hasnans:
+        return df.iloc[::-1] if descending else df
+    return df.sort_values(column, ascending=not descending, kind="stable", na_position="last")
+
+
+@timed()
+def table_view(df, key, filters=(), date_column=None, sort=None, descending=False, derive=None):
+    columns = list(df.columns)
+    with st.expander("Filter & sort"):
+        mask = filter_mask(df, key, filters, date_column)
+        c1, c2, c3 = st.columns(3)
+        sort_options = ["(none)"] + columns
+        sort_col = c1.selectbox("Sort by", sort_options, index=sort_options.index(sort) if sort else 0,
+                                key=f"{key}_sort")
+        desc = c2.toggle("Descending", value=descending, key=f"{key}_desc")
+        page_size = c3.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_size")
+
+    view = df[mask] if not mask.all() else df
+    view = sort_view(view, None if sort_col == "(none)" else sort_col, desc)
+
+    pages = max(1, math.ceil(len(view) / page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    start = (page - 1) * page_size
+    visible = view.iloc[start:start + page_size]
+    if derive is not None:
+        visible = derive(visible)
+    show_table(visible)
+    shown = f"Rows {start + 1 if len(visible) else 0}-{start + len(visible)} of {len(view)}"
+    st.caption(shown if len(view) == len(df) else f"{shown} (filtered from {len(df)})")
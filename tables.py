@@ -0,0 +1,306 @@
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+from aggregates import Aggregates, column_total
+from analytics import Rollups
+from feeding import FeedingIndex
+from forecast import ForecastCache
+from lineage import LineageIndex
+from schema import coerce_frame, coerce_row
+from search import SearchIndex
+from seed_ledger import SeedLedger
+from storage import TABLES, StaleTable
+from strain_stats import StrainStats
+
+# ===================== APPEND-BUFFERED TABLES =====================
+# Inserts land in a plain list of dicts. The DataFrame is only built when a
+# page reads the table: the pending rows become one new chunk and the chunks
+# are concatenated once and cached until the next append. Updates and
+# deletes work on the materialised frame. Tables are shared by every
+# session, so the buffer and chunks are only touched under the table lock.
+
+
+class Table:
+    def __init__(self, name, columns, frame=None, version=0):
+        self.name = name
+        self.columns = list(columns)
+        self._chunks = [] if frame is None else [frame]
+        self._rows = []
+        self._ids = []
+        self._frame = frame
+        self._length = 0 if frame is None else len(frame)
+        self.version = version
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return self._length
+
+    def append(self, row, row_id=None):
+        with self._lock:
+            self._rows.append(row)
+            self._ids.append(row_id)
+            self._length += 1
+            self.version += 1
+            self._frame = None
+
+    @property
+    def frame(self):
+        with self._lock:
+            return self._materialise()
+
+    def _materialise(self):
+        if self._frame is None:
+            if self._rows:
+                chunk = pd.DataFrame(self._rows, columns=self.columns, index=pd.Index(self._ids, name="id"))
+                chunk = coerce_frame(self.name, chunk)
+                self._chunks.append(chunk)
+                self._rows, self._ids = [], []
+            if not self._chunks:
+                self._chunks = [coerce_frame(self.name, pd.DataFrame(columns=self.columns, index=pd.Index([], name="id")))]
+            elif len(self._chunks) > 1:
+                self._chunks = [pd.concat(self._chunks)]
+            self._frame = self._chunks[0]
+        return self._frame
+
+    def append_frame(self, df):
+        # A whole batch becomes its own chunk, after any rows already pending
+        with self._lock:
+            if self._rows:
+                self._materialise()
+            self._chunks.append(coerce_frame(self.name, df))
+            self._length += len(df)
+            self.version += 1
+            self._frame = None
+
+    def get(self, row_id):
+        return self.frame.loc[row_id].to_dict()
+
+    def update(self, row_id, changes):
+        with self._lock:
+            # copy first: readers may still hold the current frame
+            frame = self._materialise().copy()
+            old = frame.loc[row_id].to_dict()
+            changes = coerce_row(self.name, changes)
+            columns = list(changes)
+            frame.loc[row_id, columns] = [changes[c] for c in columns]
+            self._chunks = [frame]
+            self._frame = frame
+            self.version += 1
+        return old, {**old, **changes}
+
+    def delete(self, row_id):
+        with self._lock:
+            old = self.get(row_id)
+            self._chunks = [self._materialise().drop(index=row_id)]
+            self._frame = self._chunks[0]
+            self._length -= 1
+            self.version += 1
+        return old
+
+
+class RowConflict(Exception):
+    # The row being edited was changed or removed by someone else
+    pass
+
+
+class TableStore:
+    # Same read/write interface as Storage; tables are loaded from the
+    # database the first time a page touches them and kept in memory.
+    #
+    # One store is shared by all sessions on the server. Writes go to SQLite
+    # with the version the in-memory table was read at; if another process
+    # wrote in between, the table is reloaded and the write retried, so
+    # inserts are never lost. Updates and deletes only retry when their own
+    # row is unchanged, otherwise they raise RowConflict.
+    def __init__(self, storage, frames=None):
+        self.storage = storage
+        self._tables = {name: Table(name, TABLES[name], df) for name, df in (frames or {}).items()}
+        self.aggregates = Aggregates()
+        self.rollups = Rollups()
+        self.feeding = FeedingIndex()
+        self.lineage = LineageIndex()
+        self.strain_stats = StrainStats()
+        self.seeds = SeedLedger()
+        self.search_index = SearchIndex()
+        # derived views kept in step with every write
+        self.views = [self.aggregates, self.rollups, self.feeding, self.lineage, self.strain_stats, self.seeds,
+                      self.search_index]
+        self._loaded = set()
+        self.lock = threading.RLock()
+        self.forecasts = ForecastCache()
+
+    def table(self, name):
+        with self.lock:
+            if name not in self._tables:
+                df, version = self.storage.load(name)
+                self._tables[name] = Table(name, TABLES[name], df, version)
+            table = self._tables[name]
+            if name not in self._loaded:
+                self._loaded.add(name)
+                for view in self.views:
+                    view.load(name, table.frame)
+            return table
+
+    def refresh(self, name):
+        with self.lock:
+            self._tables.pop(name, None)
+            self._loaded.discard(name)
+            return self.table(name)
+
+    def sync(self):
+        # Pick up writes made by other processes; one small query per rerun
+        if self.storage is None:
+            return
+        with self.lock:
+            for name, version in self.storage.versions().items():
+                if name in self._tables and self._tables[name].version != version:
+                    self.refresh(name)
+
+    @contextmanager
+    def batch(self):
+        # Writes inside commit together. If one fails the rest are rolled
+        # back and the tables they touched reloaded to match.
+        with self.lock:
+            before = {name: table.version for name, table in self._tables.items()}
+            try:
+                with self.storage.batch():
+                    yield
+            except BaseException:
+                for name in [n for n, t in self._tables.items() if before.get(n) != t.version]:
+                    self.refresh(name)
+                raise
+
+    def _write(self, name, write, row_id=None):
+        # Runs write(expected_version) until it lands on the current version
+        table = self.table(name)
+        before = None if row_id is None else table.get(row_id)
+        while True:
+            try:
+                return table, table.version + 1, write(table.version)
+            except StaleTable:
+                table = self.refresh(name)
+                if row_id is not None and (row_id not in table.frame.index
+                                           or not pd.Series(table.get(row_id)).equals(pd.Series(before))):
+                    raise RowConflict(f"{name} row {row_id} was changed by someone else")
+
+    def insert(self, name, row):
+        with self.lock:
+            table, version, row_id = self._write(name, lambda v: self.storage.insert(name, row, expected=v))
+            table.append(row, row_id)
+            for view in self.views:
+                view.on_insert(name, row_id, row)
+            table.version = version
+            return row_id
+
+    def insert_many(self, name, rows):
+        with self.lock:
+            table, version, row_ids = self._write(name, lambda v: self.storage.insert_many(name, rows, expected=v))
+            for row, row_id in zip(rows, row_ids):
+                table.append(row, row_id)
+                for view in self.views:
+                    view.on_insert(name, row_id, row)
+            table.version = version
+            return row_ids
+
+    def insert_frame(self, name, df):
+        # Bulk path for imports: one executemany, one new chunk, one view pass
+        df = coerce_frame(name, df.reindex(columns=TABLES[name]))
+        if len(df) == 0:
+            return pd.Index([], name="id")
+        with self.lock:
+            table, version, row_ids = self._write(name, lambda v: self.storage.insert_frame(name, df, expected=v))
+            df.index = pd.Index(row_ids, name="id")
+            table.append_frame(df)
+            for view in self.views:
+                view.on_insert_frame(name, df)
+            table.version = version
+            return df.index
+
+    def update(self, name, row_id, changes):
+        with self.lock:
+            table, version, _ = self._write(
+                name, lambda v: self.storage.update(name, row_id, changes, expected=v), row_id)
+            old, new = table.update(row_id, changes)
+            for view in self.views:
+                view.on_update(name, row_id, old, new)
+            table.version = version
+
+    def delete(self, name, row_id):
+        with self.lock:
+            table, version, _ = self._write(name, lambda v: self.storage.delete(name, row_id, expected=v), row_id)
+            old = table.delete(row_id)
+            for view in self.views:
+                view.on_delete(name, row_id, old)
+            table.version = version
+
+    def read(self, name, columns=None, order_by=None, descending=False, limit=None):
+        df = self.table(name).frame
+        df = df[columns] if columns else df.copy(deep=False)
+        if order_by:
+            df = df.sort_values(order_by, ascending=not descending, kind="stable")
+        if limit is not None:
+            df = df.head(limit)
+        return df
+
+    def data_version(self):
+        return tuple(self.table(name).version for name in TABLES)
+
+    def snapshot(self):
+        # Read-only copy for background work; never touches the row buffers
+        with self.lock:
+            return TableStore(None, {name: self.read(name) for name in TABLES})
+
+    def count(self, name):
+        return len(self.table(name))
+
+    def total(self, name, column, weight=None):
+        self.table(name)
+        if self.aggregates.tracks(name, column, weight):
+            return self.aggregates.total(name, column, weight)
+        return column_total(self.table(name).frame, column, weight)
+
+    def financials(self):
+        # A copy, so charts can be built while other sessions write
+        with self.lock:
+            self.table("income")
+            self.table("expenses")
+            return self.rollups.copy()
+
+    def seeds_on_hand(self):
+        with self.lock:
+            self.table("stock")
+            return self.seeds.seeds_on_hand()
+
+    def forecast(self, today=None):
+        # Shared by every session; don't modify the frame
+        return self.forecasts.get(self, today)
+
+    def check_aggregates(self):
+        return self.aggregates.check(self)
+
+
+class UserStore:
+    # A session's handle on the shared TableStore: reads pass straight
+    # through, new rows are tagged with the logged-in user.
+    def __init__(self, store, user):
+        self.store = store
+        self.user = user
+
+    def __getattr__(self, attr):
+        return getattr(self.store, attr)
+
+    def _stamp(self, row):
+        return row if row.get("Created By") else {**row, "Created By": self.user}
+
+    def insert(self, name, row):
+        return self.store.insert(name, self._stamp(row))
+
+    def insert_many(self, name, rows):
+        return self.store.insert_many(name, [self._stamp(row) for row in rows])
+
+    def insert_frame(self, name, df):
+        by = df["Created By"] if "Created By" in df.columns else pd.Series(None, index=df.index, dtype=object)
+        blank = by.isna() | (by.astype(str).str.strip() == "")
+        return self.store.insert_frame(name, df.assign(**{"Created By": by.where(~blank, self.user)}))
@@ -0,0 +1,3 @@
+# One module per sidebar page, each with render(store). app.py imports a
+# page only when it is opened, so its dependencies (plotly, openpyxl...) load
+# on first use.
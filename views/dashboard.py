@@ -0,0 +1,23 @@
+import pandas as pd
+import streamlit as st
+
+
+def render(store):
+    st.title("Dashboard")
+    c1, c2, c3, c4 = st.columns(4)
+    expenses = store.total("expenses", "Cost (ZAR)")
+    income = store.total("income", "Grams Sold", weight="Price per Gram")
+    c1.metric("Total Plants", store.count("plants"))
+    c2.metric("Total Yield", f"{store.total('plants', 'Trimmed Yield (g)'):.1f} g")
+    c3.metric("Total Expenses", f"R {expenses:,.2f}")
+    c4.metric("Total Income", f"R {income:,.2f}")
+    st.metric("Net Profit", f"R {income - expenses:,.2f}")
+
+    with st.expander("Consistency check"):
+        if st.button("Recompute totals from scratch"):
+            drift = store.check_aggregates()
+            if drift:
+                st.warning("Maintained totals drifted from the tables")
+                st.dataframe(pd.DataFrame(drift), use_container_width=True, hide_index=True)
+            else:
+                st.success("All maintained totals match a full recompute")
@@ -0,0 +1,37 @@
+from datetime import date
+
+import streamlit as st
+
+from schema import EXPENSE_CATEGORIES
+from table_view import table_view
+from views.search import show_focus
+
+
+def render(store):
+    st.title("Expenses Tracker")
+    show_focus(store, "expenses")
+    t1, t2 = st.tabs(["View", "Add Expense"])
+    with t1:
+        df = store.read("expenses")
+        if len(df) > 0:
+            table_view(df, "expenses", filters=["Category"], date_column="Date", sort="Date", descending=True)
+        else:
+            st.info("No expenses yet")
+    with t2:
+        c1, c2 = st.columns(2)
+        with c1:
+            date_e = st.date_input("Date", date.today())
+            cat = st.selectbox("Category", EXPENSE_CATEGORIES)
+            item = st.text_input("Item *")
+            cost = st.number_input("Cost (ZAR)", 0.0, step=0.01)
+        with c2:
+            qty = st.number_input("Quantity", 1, step=1)
+            paid = st.text_input("Paid To")
+            notes = st.text_area("Notes")
+        if st.button("Add Expense", type="primary"):
+            store.insert("expenses", {
+                "Date": date_e, "Category": cat, "Item": item, "Supplier": "", 
+                "Cost (ZAR)": cost, "Quantity": qty, "Paid To": paid, "Notes": notes, "Receipt Link": ""
+            })
+            st.success("Expense added!")
+            st.rerun()
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import streamlit as st
+
+from export import ExportCache
+
+
+@st.cache_resource
+def get_export_executor():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+
+# Builds run on the export pool; this fragment polls until the file is ready
+@st.fragment(run_every=1)
+def export_download(store):
+    job = st.session_state.export_cache.get(store)
+    if job is None:
+        return
+    if not job.done():
+        st.info("Building Excel file...")
+    elif job.exception() is not None:
+        st.error(f"Export failed: {job.exception()}")
+    else:
+        st.download_button("DOWNLOAD NOW", job.result(), f"Cannabis_Grow_Tracker_{date.today()}.xlsx",
+                           "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        st.success("File ready!")
+
+
+def render(store):
+    if 'export_cache' not in st.session_state:
+        st.session_state.export_cache = ExportCache(get_export_executor())
+    st.title("Export to Excel")
+    if st.button("Generate Excel File", type="primary"):
+        st.session_state.export_cache.submit(store)
+    export_download(store)
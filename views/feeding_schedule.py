@@ -0,0 +1,123 @@
+from datetime import date
+
+import plotly.express as px
+import streamlit as st
+
+from config import NUTRIENTS, FEED_GROUPS
+from feeding import record_feeding, feeding_index, wide_schedule, plant_history, nutrient_totals, weekly_usage
+from stages import STAGE_DATE_COLUMNS, get_current_stage
+from table_view import table_view
+from views.search import show_focus
+
+
+def render(store):
+    st.title("Feeding Schedule")
+    show_focus(store, "feeding")
+
+    tab1, tab2, tab3, tab4 = st.tabs(["Add Feeding", "History", "By Plant", "Nutrient Usage"])
+
+    with tab1:
+        with st.form("feeding_form", clear_on_submit=True):
+            feed_date = st.date_input("Date", value=date.today())
+
+            # Plant selection
+            current_plants = store.read("plants", ["Plant ID"] + STAGE_DATE_COLUMNS)
+            if len(current_plants) == 0:
+                st.warning("No plants yet. Add plants first.")
+                plant_options = []
+            else:
+                current_plants["Current Stage"] = get_current_stage(current_plants)
+                plant_options = current_plants["Plant ID"].tolist()
+
+            selected_plant = st.selectbox("Select single plant", ["(none)"] + plant_options)
+            group = st.selectbox("Or feed a group", FEED_GROUPS)
+
+            final_plants = []
+            if group != "None":
+                if group == "All Plants":
+                    final_plants = plant_options
+                else:
+                    stage_prefix = group.replace("All in ", "")
+                    final_plants = current_plants[current_plants["Current Stage"].str.startswith(stage_prefix)]["Plant ID"].tolist()
+                st.info(f"Selected: {', '.join(final_plants)}")
+            elif selected_plant != "(none)":
+                final_plants = [selected_plant]
+
+            # Nutrients
+            col1, col2 = st.columns(2)
+            with col1:
+                nut1 = st.selectbox("Nutrient 1", ["None"] + NUTRIENTS)
+                if nut1 == "Other (type below)":
+                    nut1_name = st.text_input("Specify nutrient name")
+                else:
+                    nut1_name = nut1
+            with col2:
+                amt1 = st.number_input("Amount 1 (ml/L)", 0.0, step=0.1, key="a1")
+
+            more = st.radio("More nutrients?", ("No", "Yes"))
+            extra = {}
+
+            if more == "Yes":
+                how_many = st.selectbox("How many more?", [1,2,3,4,5])
+                for i in range(how_many):
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        n = st.selectbox(f"Nutrient {i+2}", NUTRIENTS, key=f"n{i+2}")
+                        if n == "Other (type below)":
+                            n_name = st.text_input(f"Specify name", key=f"on{i+2}")
+                        else:
+                            n_name = n
+                        extra[f"nut{i+2}"] = n_name
+                    with c2:
+                        extra[f"amt{i+2}"] = st.number_input(f"Amount {i+2} (ml/L)", 0.0, step=0.1, key=f"a{i+2}")
+
+            notes = st.text_area("Notes (pH, EC, water volume, etc.)")
+
+            if st.form_submit_button("Record Feeding", type="primary"):
+                if not final_plants:
+                    st.error("Select at least one plant")
+                elif nut1 == "None":
+                    st.error("Select at least one nutrient")
+                else:
+                    stages = current_plants.drop_duplicates("Plant ID").set_index("Plant ID")["Current Stage"]
+                    plant_stages = {p: stages.get(p) for p in final_plants}
+                    doses = [(nut1_name, amt1)] + [(extra[f"nut{i}"], extra[f"amt{i}"])
+                                                   for i in range(2, 7) if f"nut{i}" in extra]
+                    record_feeding(store, feed_date, group if group != "None" else plant_stages[final_plants[0]],
+                                   plant_stages, doses, notes)
+                    st.success(f"Feeding recorded for {len(final_plants)} plant(s)!")
+                    st.rerun()
+
+    with tab2:
+        display_df = wide_schedule(store)
+        if len(display_df) > 0:
+            table_view(display_df, "feeding", filters=["Stage"], date_column="Date", sort="Date", descending=True)
+        else:
+            st.info("No feeding records yet")
+
+    with tab3:
+        fed_plants = sorted(feeding_index(store).by_plant)
+        if fed_plants:
+            plant = st.selectbox("Plant", fed_plants, key="feeding_plant")
+            c1, c2 = st.columns([2, 1])
+            with c1:
+                table_view(plant_history(store, plant), "feeding_plant_history", filters=["Nutrient"],
+                           date_column="Date")
+            with c2:
+                st.dataframe(nutrient_totals(store, [plant]), use_container_width=True)
+        else:
+            st.info("No feeding records yet")
+
+    with tab4:
+        usage = weekly_usage(store)
+        if len(usage) > 0:
+            st.plotly_chart(px.bar(usage, labels={"value": "ml/L", "variable": "Nutrient"},
+                                   title="Nutrient use per week"), use_container_width=True)
+            batches = store.read("plants", ["Plant ID", "Batch #"])
+            batch_ids = sorted(batches["Batch #"].dropna().astype(str).unique())
+            grow = st.selectbox("Grow (Batch #)", ["All plants"] + batch_ids)
+            plant_ids = None if grow == "All plants" else batches.loc[batches["Batch #"].astype(str) == grow, "Plant ID"]
+            st.subheader("Cumulative ml/L per nutrient")
+            st.dataframe(nutrient_totals(store, plant_ids), use_container_width=True)
+        else:
+            st.info("No feeding records yet")
@@ -0,0 +1,39 @@
+import plotly.express as px
+import streamlit as st
+
+from analytics import FREQS
+from schema import EXPENSE_CATEGORIES
+
+
+def render(store):
+    st.title("Financials")
+    rollups = store.financials()
+    months = rollups.months()
+    if not months:
+        st.info("No income or expenses yet")
+    else:
+        period = st.radio("Period", list(FREQS), horizontal=True)
+        pnl = rollups.profit_and_loss(FREQS[period])
+        fig = px.bar(pnl, x="Period", y=["Income", "Expenses"], barmode="group",
+                     title=f"{period} income vs expenses", labels={"value": "ZAR", "variable": ""})
+        fig.add_scatter(x=pnl["Period"], y=pnl["Net"], mode="lines+markers", name="Net")
+        st.plotly_chart(fig, use_container_width=True)
+
+        if len(months) > 1:
+            start, end = st.select_slider("Months", options=months, value=(months[0], months[-1]),
+                                          format_func=lambda m: m.strftime("%b %Y"))
+        else:
+            start = end = months[0]
+
+        c1, c2 = st.columns(2)
+        spend = rollups.breakdown("category", start, end)
+        spend = spend.reindex([c for c in EXPENSE_CATEGORIES if c in spend.index]
+                              + [c for c in spend.index if c not in EXPENSE_CATEGORIES])
+        c1.plotly_chart(px.bar(x=spend.index, y=spend.values, title="Spend by category",
+                               labels={"x": "Category", "y": "ZAR"}), use_container_width=True)
+        by_strain = rollups.breakdown("strain", start, end)
+        c2.plotly_chart(px.bar(x=by_strain.index, y=by_strain.values, title="Revenue by strain",
+                               labels={"x": "Strain", "y": "ZAR"}), use_container_width=True)
+        by_method = rollups.breakdown("payment", start, end)
+        c1.plotly_chart(px.pie(names=by_method.index, values=by_method.values, title="Revenue by payment method"),
+                        use_container_width=True)
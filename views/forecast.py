@@ -0,0 +1,37 @@
+import pandas as pd
+import streamlit as st
+
+from forecast import PRIOR_WEIGHT, weekly_projection, calendar_month
+from table_view import table_view
+
+
+def render(store):
+    st.title("Harvest Forecast")
+    df = store.forecast()
+    if len(df) == 0:
+        st.info("No growing plants with a germination, transplant or flip date")
+        return
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Growing plants", len(df))
+    c2.metric("Due in 14 days", int((df["Days Left"] <= 14).sum()))
+    c3.metric("Overdue", int(df["Overdue"].sum()))
+    c4.metric("Projected grams", f"{df['Expected Yield (g)'].sum():,.0f} g")
+    st.caption(f"Flowering days and yields are per-strain history blended with the strain's Expected Flower "
+               f"Time (or the all-strain average) weighted as {PRIOR_WEIGHT} plants.")
+
+    t1, t2, t3 = st.tabs(["Week by Week", "Calendar", "Plants"])
+    with t1:
+        weekly = weekly_projection(df)
+        st.bar_chart(weekly, x="Week Starting", y="Projected Grams")
+        st.dataframe(weekly, use_container_width=True, hide_index=True,
+                     column_config={"Week Starting": st.column_config.DateColumn("Week Starting")})
+    with t2:
+        months = pd.date_range(df["Projected Harvest"].min().to_period("M").start_time,
+                               df["Projected Harvest"].max(), freq="MS")
+        month = st.selectbox("Month", months, format_func=lambda m: m.strftime("%B %Y"))
+        st.dataframe(calendar_month(df, month), use_container_width=True, hide_index=True)
+        st.caption("day: plants due (projected grams)")
+    with t3:
+        table_view(df, "forecast", filters=["Strain Name", "Current Stage", "Overdue"],
+                   date_column="Projected Harvest")
@@ -0,0 +1,43 @@
+import streamlit as st
+
+from importer import SHEET_TABLES, import_file
+
+
+def render(store):
+    st.title("Import")
+    st.caption("CSV files go into one table. Excel files exported from this app import every sheet.")
+    st.caption("Seed-type plants book one seed out of Seed Stock, unless the ledger already has one for them. "
+               "Import seed stock before plants.")
+    upload = st.file_uploader("CSV or Excel file", type=["csv", "xlsx"])
+    sheet_names = {table: sheet for sheet, table in SHEET_TABLES.items()}
+    target = st.selectbox("Table (CSV only)", list(sheet_names), format_func=sheet_names.get)
+    if upload is not None and st.button("Import", type="primary"):
+        # chunks are streamed, so there's no total to show a fraction of
+        status = st.status("Importing...")
+
+        def progress(report):
+            status.update(label=f"{sheet_names[report.table]}: {report.accepted:,} rows imported, "
+                                f"{report.rejected_count:,} rejected so far")
+
+        try:
+            reports = import_file(store, upload, table=target if upload.name.lower().endswith(".csv") else None,
+                                  filename=upload.name, progress=progress)
+        except Exception as e:
+            status.update(label="Import failed", state="error")
+            st.error(f"Import failed: {e}")
+        else:
+            status.update(label="Import finished", state="complete")
+            if not reports:
+                st.warning("No sheets in that file match a table")
+            for report in reports:
+                name = sheet_names[report.table]
+                st.success(f"{name}: {report.accepted} rows imported, {report.rejected_count} rejected")
+                if report.seeds_booked or report.seeds_missing:
+                    st.info(f"{report.seeds_booked} seeds booked out of stock"
+                            + (f", {report.seeds_missing} seed plants had no stock of their strain"
+                               if report.seeds_missing else ""))
+                if report.rejected_count:
+                    rejected = report.rejected_rows
+                    st.dataframe(rejected.head(1000), use_container_width=True, hide_index=True)
+                    st.download_button(f"Download rejected {name} rows", rejected.to_csv(index=False),
+                                       f"rejected_{report.table}.csv", "text/csv", key=f"rejected_{report.table}")
@@ -0,0 +1,35 @@
+from datetime import date
+
+import streamlit as st
+
+from config import INCOME_SOURCES
+from schema import PAYMENT_METHODS
+from table_view import table_view
+
+
+def render(store):
+    st.title("Income Tracker")
+    t1, t2 = st.tabs(["View", "Add Income"])
+    with t1:
+        df = store.read("income")
+        if len(df)>0:
+            table_view(df, "income", filters=["Strain", "Payment Method"], date_column="Date", sort="Date",
+                       descending=True, derive=lambda v: v.assign(Total=v["Grams Sold"] * v["Price per Gram"]))
+        else:
+            st.info("No income yet")
+    with t2:
+        c1, c2 = st.columns(2)
+        with c1:
+            date_i = st.date_input("Date", date.today())
+            strain_i = st.text_input("Strain")
+            grams = st.number_input("Grams Sold", 0.0, step=0.1)
+            ppg = st.number_input("Price per Gram", 0.0, step=0.01)
+            source = st.selectbox("Source", INCOME_SOURCES)
+        with c2:
+            buyer = st.text_input("Buyer/Channel")
+            method = st.selectbox("Payment Method", PAYMENT_METHODS)
+        if st.button("Add Income", type="primary"):
+            store.insert("income", {"Date": date_i, "Strain": strain_i, "Grams Sold": grams,
+                                    "Price per Gram": ppg, "Buyer/Channel": buyer,
+                                    "Payment Method": method, "Notes": ""})
+            st.rerun()
@@ -0,0 +1,21 @@
+import streamlit as st
+
+from instrumentation import recorder, PROFILERS
+
+
+def render_panel():
+    with st.sidebar.expander("⏱ Performance"):
+        recorder.enabled = st.toggle("Record rerun timings", value=recorder.enabled)
+        st.caption(f"{len(recorder.runs)} reruns buffered (last {recorder.runs.maxlen})")
+        if len(recorder.runs):
+            st.dataframe(recorder.stats(), use_container_width=True, hide_index=True)
+            st.dataframe(recorder.recent(10), use_container_width=True, hide_index=True)
+        kind = st.selectbox("Profile each rerun with", PROFILERS, index=PROFILERS.index(recorder.profiler))
+        keep = st.number_input("Keep last N reruns", 1, 50, value=recorder.profiles.maxlen)
+        recorder.set_profiler(kind, int(keep))
+        if kind != "Off" and not recorder.enabled:
+            st.info("Profiling runs only while timings are recorded")
+        if recorder.profiles and st.button("Dump profile"):
+            name, data, summary = recorder.dump()
+            st.download_button(f"Download {name}", data, name, "application/octet-stream")
+            st.code(summary)
@@ -0,0 +1,159 @@
+import pandas as pd
+import streamlit as st
+
+from lineage import lineage_index, lineage_frame
+from seed_ledger import consume_seed, plant_seed_costs
+from schema import VARIETIES, GENDERS, ENVIRONMENTS, PLANT_TYPES, STATUSES
+from stages import get_current_stage, calculate_flowering_days, calculate_total_days
+from table_view import table_view
+from views.search import show_focus
+from tables import RowConflict
+
+
+def render(store):
+    st.title("Plants Tracker")
+    show_focus(store, "plants")
+    tab1, tab2, tab3, tab4 = st.tabs(["View Plants", "Add New Plant", "Record Harvest", "Lineage"])
+
+    with tab1:
+        df = store.read("plants")
+        if len(df) > 0:
+            df["Current Stage"] = get_current_stage(df)
+            table_view(df, "plants", filters=["Strain Name", "Status", "Current Stage"],
+                       date_column="Date Germination",
+                       derive=lambda v: v.assign(**{
+                           "Flowering Days": calculate_flowering_days(v["Date Flip Flower"], v["Date Harvest"]),
+                           "Total Days": calculate_total_days(v["Date Germination"], v["Date Harvest"]),
+                       }).join(plant_seed_costs(store, v)))
+        else:
+            st.info("No plants yet")
+
+    with tab2:
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            plant_id = st.text_input("Plant ID *")
+            strain = st.text_input("Strain Name *")
+            variety = st.selectbox("Variety", VARIETIES)
+            gender = st.selectbox("Gender", GENDERS)
+            environment = st.selectbox("Environment", ENVIRONMENTS)
+            type_p = st.selectbox("Type", PLANT_TYPES)
+        with c2:
+            source = st.text_input("Source")
+            batch = st.text_input("Batch #")
+            date_germ = st.date_input("Date Germination", value=None)
+            date_trans = st.date_input("Date Transplant Veg", value=None)
+            date_flip = st.date_input("Date Flip Flower", value=None)
+            date_harvest = st.date_input("Date Harvest", value=None)
+        with c3:
+            pot = st.number_input("Pot Size (L)", 0.0, step=0.5)
+            medium = st.text_input("Medium")
+            rating = st.slider("Rating", 1, 10, 5)
+            status = st.selectbox("Status", STATUSES)
+            mother = st.text_input("Mother ID", help="Plant ID this plant was cloned or bred from").strip()
+
+        notes = st.text_area("Phenotype Notes")
+        health = st.text_area("Health Issues")
+        photos = st.text_input("Photos Link")
+
+        if st.button("Add Plant", type="primary") and plant_id and strain:
+            if mother and mother == plant_id.strip():
+                st.error("A plant can't be its own mother")
+                st.stop()
+            plant = {
+                "Plant ID": plant_id, "Strain Name": strain, "Variety": variety, "Gender": gender,
+                "Environment": environment, "Type": type_p, "Source": source, "Batch #": batch,
+                "Date Germination": date_germ, "Date Transplant Veg": date_trans,
+                "Date Flip Flower": date_flip, "Date Harvest": date_harvest,
+                "Wet Weight (g)": 0, "Dry Weight (g)": 0, "Trimmed Yield (g)": 0,
+                "Mother ID": mother, "Pot Size (L)": pot, "Medium": medium,
+                "Phenotype Notes": notes, "Health Issues": health,
+                "Rating (1-10)": rating, "Photos Link": photos, "Status": status
+            }
+            # the plant and its seed land together or not at all
+            with store.batch():
+                store.insert("plants", plant)
+                if type_p == "Seed":
+                    cost, booked = consume_seed(store, plant)
+            if type_p == "Seed":
+                if cost is None:
+                    st.toast(f"No {strain} seeds in stock - nothing booked out", icon="⚠️")
+                elif booked:
+                    st.toast(f"One {strain} seed booked out (R {cost:,.2f})")
+                else:
+                    st.toast(f"{plant_id} already has a seed booked out (R {cost:,.2f})")
+            st.success("Plant added!")
+            st.rerun()
+
+    with tab3:
+        record_harvest(store)
+
+    with tab4:
+        index = lineage_index(store)
+        with store.lock:
+            mothers = index.mothers()
+        if not mothers:
+            st.info("No mother/clone links yet. Fill in Mother ID when adding a plant.")
+            return
+        c1, c2 = st.columns(2)
+        picked = c1.selectbox("Mother", mothers[:1000],
+                              format_func=lambda m: f"{m} ({index.subtree[m][0]} descendants)")
+        typed = c2.text_input("...or any Plant ID").strip()
+        plant = typed or picked
+        with store.lock:
+            chain = index.ancestry(plant)
+            summary = index.summary(plant)
+        st.caption("Ancestry: " + " ← ".join([plant] + chain))
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Descendants", summary["Descendants"])
+        m2.metric("Direct children", summary["Direct children"])
+        m3.metric("Combined trimmed yield", f"{summary['Combined Trimmed Yield (g)']:.1f} g")
+        m4.metric("Average rating", "-" if summary["Average Rating"] is None else f"{summary['Average Rating']:.1f}")
+        descendants = lineage_frame(store, plant)
+        if len(descendants):
+            table_view(descendants, "lineage", filters=["Generation", "Type", "Status"])
+        if index.cycles:
+            st.warning(f"Ignored Mother ID links that form a loop: {', '.join(sorted(index.cycles)[:20])}")
+
+
+def _date(value):
+    return None if pd.isna(value) else value.date()
+
+
+def _grams(value):
+    return 0.0 if pd.isna(value) else float(value)
+
+
+def record_harvest(store):
+    plant_id = st.text_input("Plant ID", key="harvest_plant").strip()
+    if not plant_id:
+        st.info("Enter a Plant ID to update its flip / harvest dates and weights")
+        return
+    with store.lock:
+        row_ids = lineage_index(store).row_ids([plant_id])
+    if not row_ids:
+        st.warning(f"No plant with ID {plant_id}")
+        return
+    # duplicate Plant IDs: the latest row is the one that counts
+    row_id = row_ids[-1]
+    row = store.table("plants").get(row_id)
+    st.caption(f"{row['Strain Name']} · {row['Status'] if pd.notna(row['Status']) else 'no status'}")
+    with st.form(f"harvest_{row_id}"):
+        c1, c2, c3 = st.columns(3)
+        date_flip = c1.date_input("Date Flip Flower", value=_date(row["Date Flip Flower"]))
+        date_harvest = c1.date_input("Date Harvest", value=_date(row["Date Harvest"]))
+        wet = c2.number_input("Wet Weight (g)", 0.0, value=_grams(row["Wet Weight (g)"]), step=1.0)
+        dry = c2.number_input("Dry Weight (g)", 0.0, value=_grams(row["Dry Weight (g)"]), step=1.0)
+        trimmed = c3.number_input("Trimmed Yield (g)", 0.0, value=_grams(row["Trimmed Yield (g)"]), step=1.0)
+        status = c3.selectbox("Status", STATUSES,
+                              index=STATUSES.index(row["Status"]) if row["Status"] in STATUSES else 0)
+        if st.form_submit_button("Save Harvest", type="primary"):
+            try:
+                store.update("plants", row_id, {
+                    "Date Flip Flower": date_flip, "Date Harvest": date_harvest,
+                    "Wet Weight (g)": wet, "Dry Weight (g)": dry, "Trimmed Yield (g)": trimmed, "Status": status,
+                })
+            except RowConflict as e:
+                st.error(f"{e} - reload the page and try again")
+            else:
+                st.success("Harvest saved!")
+                st.rerun()
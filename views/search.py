@@ -0,0 +1,48 @@
+import streamlit as st
+
+from search import search
+from table_view import show_table
+
+# table -> page that shows its records
+RECORD_PAGES = {
+    "plants": "Plants Tracker",
+    "strains": "Strains Library",
+    "expenses": "Expenses",
+    "feeding": "Feeding Schedule",
+}
+MAX_HITS = 10
+
+
+def render_box(store):
+    query = st.sidebar.text_input("🔎 Search notes", key="search_query",
+                                  placeholder="e.g. powdery mildew, EC 1.8").strip()
+    if not query:
+        return
+    hits = search(store, query, MAX_HITS)
+    if len(hits) == 0:
+        st.sidebar.caption("No matches")
+        return
+    for hit in hits.itertuples(index=False):
+        if st.sidebar.button(f"{RECORD_PAGES[hit.Table]}: {hit.Record}", key=f"hit_{hit.Table}_{hit.Row}",
+                             use_container_width=True):
+            st.session_state.page = RECORD_PAGES[hit.Table]
+            st.session_state.search_focus = (hit.Table, hit.Row)
+        st.sidebar.caption(f"{hit.Field}: {hit.Snippet}")
+
+
+def show_focus(store, table):
+    # The record a search hit was opened from, above the page's own tables
+    focus = st.session_state.get("search_focus")
+    if not focus or focus[0] != table:
+        return
+    frame = store.table(table).frame
+    if focus[1] not in frame.index:
+        del st.session_state.search_focus
+        return
+    with st.container(border=True):
+        c1, c2 = st.columns([6, 1])
+        c1.markdown("**Search result**")
+        if c2.button("Close", key="search_focus_close"):
+            del st.session_state.search_focus
+            st.rerun()
+        show_table(frame.loc[[focus[1]]])
@@ -0,0 +1,65 @@
+from datetime import date
+
+import streamlit as st
+
+from seed_ledger import seed_ledger, strain_seed_costs
+from table_view import table_view
+
+
+def render(store):
+    st.title("Seed Stock")
+    t1, t2, t3, t4 = st.tabs(["Balances", "Ledger", "Receive Seeds", "Seed Cost per Gram"])
+    ledger = seed_ledger(store)
+
+    with t1:
+        with store.lock:
+            df = ledger.balance_frame()
+        if len(df) > 0:
+            st.metric("Seeds on hand", ledger.seeds_on_hand())
+            table_view(df, "stock_balances", filters=["Strain", "Breeder"])
+        else:
+            st.info("No seed stock recorded yet")
+
+    with t2:
+        df = store.read("stock")
+        if len(df) > 0:
+            st.caption("Receipts and consumptions, oldest first. Adding a Seed-type plant books one seed out.")
+            table_view(df, "stock", filters=["Strain", "Breeder", "Movement"])
+        else:
+            st.info("No stock movements yet")
+
+    with t3:
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            strain_s = st.text_input("Strain *", placeholder="e.g. Rosetta 78")
+            received = st.date_input("Date Received", value=date.today())
+        with c2:
+            breeder = st.text_input("Breeder (optional)", placeholder="e.g. Ethos")
+            seeds = st.number_input("Seeds", min_value=1, step=1, value=10)
+        with c3:
+            pack_cost = st.number_input("Pack Cost (ZAR)", min_value=0.0, step=0.01, value=0.0)
+            notes = st.text_input("Notes")
+
+        if st.button("Receive Seeds", type="primary"):
+            if not strain_s.strip():
+                st.error("Strain name is required")
+            else:
+                store.insert("stock", {
+                    "Date": received,
+                    "Strain": strain_s.strip(),
+                    "Breeder": breeder.strip(),
+                    "Movement": "Receipt",
+                    "Seeds": int(seeds),
+                    "Cost (ZAR)": float(pack_cost),
+                    "Notes": notes,
+                })
+                st.success(f"{int(seeds)} {strain_s} seeds added to stock!")
+                st.rerun()
+
+    with t4:
+        df = strain_seed_costs(store)
+        if len(df) > 0:
+            st.caption("Cost of the seeds booked out to each strain's plants over their trimmed yield")
+            table_view(df, "seed_cost", filters=["Strain"], sort="Seed Cost/g (ZAR)")
+        else:
+            st.info("No seeds booked out to plants yet")
@@ -0,0 +1,36 @@
+import streamlit as st
+
+from config import STRAIN_VARIETIES
+from schema import KEEPER
+from strain_stats import strain_library
+from table_view import table_view
+from views.search import show_focus
+
+
+def render(store):
+    st.title("Strains Library")
+    show_focus(store, "strains")
+    t1, t2 = st.tabs(["View Strains", "Add New Strain"])
+    with t1:
+        df = strain_library(store)
+        if len(df)>0:
+            table_view(df, "strains", filters=["Variety", "Keeper?"], sort="Strain Name")
+        else:
+            st.info("No strains recorded yet")
+    with t2:
+        c1, c2 = st.columns(2)
+        with c1:
+            name = st.text_input("Strain Name *")
+            breeder = st.text_input("Breeder")
+            variety = st.selectbox("Variety", STRAIN_VARIETIES)
+        with c2:
+            thc = st.number_input("THC %", 0.0, 40.0, step=0.1)
+            weeks = st.text_input("Expected Flower Time (weeks)")
+            keeper = st.selectbox("Keeper?", KEEPER)
+        notes = st.text_area("Best Pheno Notes")
+        if st.button("Add Strain", type="primary") and name:
+            store.insert("strains", {"Strain Name": name, "Breeder": breeder, "Variety": variety,
+                                     "Expected Flower Time": weeks, "THC %": thc, "Terpene Profile": "",
+                                     "Best Pheno Notes": notes, "Keeper?": keeper})
+            st.success("Strain added!")
+            st.rerun()